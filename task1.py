@@ -1,6 +1,19 @@
 # Реалізація однозв'язного списку з операціями реверсування, сортування та об'єднання
 
+from array import array
+from collections import deque
+import heapq
+import math
+import operator
+import sys
+import time
+import tracemalloc
+
+import numpy as np  # Лише для сортування та злиття буферів ArrayLinkedList
+
 class Node:
+    __slots__ = ("data", "next")
+
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -8,17 +21,56 @@ class Node:
 class LinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None
+        self.length = 0
+        self._reversed_cache = None  # Знімок даних для __reversed__
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Створює список з елементів ітерованого об'єкта за один прохід."""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
 
     def append(self, data):
-        """Додає вузол із заданими даними в кінець списку."""
+        """Додає вузол із заданими даними в кінець списку за O(1)."""
         new_node = Node(data)
         if not self.head:
             self.head = new_node
-            return
-        current = self.head
-        while current.next:
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+        self._reversed_cache = None
+
+    def extend(self, iterable):
+        """Додає всі елементи ітерованого об'єкта в кінець списку за один прохід."""
+        dummy = Node(None)
+        current = dummy
+        count = 0
+        for data in iterable:
+            current.next = Node(data)
             current = current.next
-        current.next = new_node
+            count += 1
+        if not count:
+            return
+        # Приєднуємо зв'язаний ланцюжок до хвоста
+        if self.head:
+            self.tail.next = dummy.next
+        else:
+            self.head = dummy.next
+        self.tail = current
+        self.length += count
+        self._reversed_cache = None
+
+    @staticmethod
+    def _find_tail(node):
+        """Повертає останній вузол ланцюжка, що починається з node."""
+        if not node:
+            return None
+        while node.next:
+            node = node.next
+        return node
 
     def reverse(self):
         """Реверсує однозв'язний список, змінюючи вказівники між вузлами."""
@@ -29,11 +81,15 @@ class LinkedList:
             current.next = prev       # Змінюємо вказівник
             prev = current            # Переміщуємо prev на поточний
             current = next_node       # Переходимо до наступного
+        self.tail = self.head
         self.head = prev
+        self._reversed_cache = None
 
     def merge_sort(self):
         """Сортує однозв'язний список за допомогою сортування злиттям."""
         self.head = self._merge_sort(self.head)
+        self.tail = self._find_tail(self.head)
+        self._reversed_cache = None
 
     def _merge_sort(self, head):
         """Допоміжна функція для сортування злиттям: рекурсивно розбиває і об'єднує."""
@@ -73,10 +129,192 @@ class LinkedList:
         current.next = left if left else right
         return dummy.next
 
+    def merge_sort_bottom_up(self, key=None, reverse=False):
+        """
+        Ітеративне природне сортування злиттям знизу вгору.
+
+        Кожен прохід знаходить готові впорядковані серії та зливає їх попарно,
+        тож відсортований або майже відсортований список обробляється майже
+        за лінійний час. Працює без рекурсії, з O(1) додаткової пам'яті та без
+        створення допоміжних вузлів. Сортування стабільне, як і sorted().
+
+        Параметри:
+            key (callable): Функція, що обчислює ключ порівняння для даних вузла.
+            reverse (bool): Сортувати за спаданням.
+        """
+        compare = operator.ge if reverse else operator.le
+        if key is None:
+            def in_order(a, b):
+                return compare(a.data, b.data)
+        else:
+            def in_order(a, b):
+                return compare(key(a.data), key(b.data))
+
+        while True:
+            new_head = prev_tail = None
+            merges = 0
+            current = self.head
+            while current:
+                # Перша серія
+                left = current
+                while current.next and in_order(current, current.next):
+                    current = current.next
+                left_tail, right = current, current.next
+                left_tail.next = None
+                merges += 1
+
+                if right is None:
+                    run_head, run_tail = left, left_tail
+                    current = None
+                else:
+                    # Друга серія
+                    current = right
+                    while current.next and in_order(current, current.next):
+                        current = current.next
+                    right_tail, rest = current, current.next
+                    right_tail.next = None
+                    run_head, run_tail = self._merge_runs(
+                        left, left_tail, right, right_tail, in_order
+                    )
+                    current = rest
+
+                # Приєднуємо злиту серію до результату проходу
+                if prev_tail:
+                    prev_tail.next = run_head
+                else:
+                    new_head = run_head
+                prev_tail = run_tail
+
+            self.head, self.tail = new_head, prev_tail
+            self._reversed_cache = None
+            if merges <= 1:
+                break
+
+    @staticmethod
+    def _merge_runs(left, left_tail, right, right_tail, in_order):
+        """Зливає дві серії без фіктивного вузла, повертаючи голову та хвіст."""
+        if in_order(left, right):
+            head, left = left, left.next
+        else:
+            head, right = right, right.next
+        current = head
+
+        while left and right:
+            if in_order(left, right):
+                current.next = left
+                left = left.next
+            else:
+                current.next = right
+                right = right.next
+            current = current.next
+
+        # Додаємо залишки — хвіст відомий заздалегідь
+        if left:
+            current.next = left
+            return head, left_tail
+        current.next = right
+        return head, right_tail
+
     def merge_sorted_lists(self, other_list):
-        """Об'єднує інший відсортований список із поточним, повертаючи новий відсортований список."""
+        """
+        Об'єднує інший відсортований список із поточним, повертаючи новий відсортований список.
+        Вузли переходять до нового списку, тож обидва вхідні списки, як
+        і в merge_k_sorted_lists, після злиття стають порожніми.
+        """
         result = LinkedList()
         result.head = self._merge(self.head, other_list.head)
+        result.tail = self._find_tail(result.head)
+        result.length = self.length + other_list.length
+        # Інакше старі head/tail вказували б усередину об'єднаного ланцюжка
+        for lst in (self, other_list):
+            lst.head = lst.tail = None
+            lst.length = 0
+            lst._reversed_cache = None
+        return result
+
+    def __iter__(self):
+        """Ліниво генерує дані вузлів від голови до хвоста."""
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __len__(self):
+        """Повертає кількість елементів за O(1)."""
+        return self.length
+
+    def __reversed__(self):
+        """
+        Генерує дані від хвоста до голови. Однозв'язний список не має
+        зворотних вказівників, тому знімок даних будується один раз і
+        кешується до наступної зміни списку.
+        """
+        if self._reversed_cache is None:
+            self._reversed_cache = tuple(self)
+        return reversed(self._reversed_cache)
+
+    @staticmethod
+    def iter_merge_sorted(*sources, key=None):
+        """
+        Ліниво зливає довільну кількість відсортованих джерел за допомогою купи.
+
+        Параметри:
+            *sources: Відсортовані LinkedList, ArrayLinkedList або ітеровані об'єкти.
+            key (callable): Функція, що обчислює ключ порівняння.
+
+        Повертає:
+            generator: Елементи в порядку зростання, без матеріалізації результату.
+        """
+        iterables = [
+            source._values() if isinstance(source, ArrayLinkedList) else source
+            for source in sources
+        ]
+        return heapq.merge(*iterables, key=key)
+
+    @classmethod
+    def merge_k_sorted_lists(cls, *lists, key=None):
+        """
+        Зливає довільну кількість відсортованих списків, перепризначаючи
+        вказівники наявних вузлів замість створення нових. Вхідні списки
+        після злиття стають порожніми.
+
+        Параметри:
+            *lists (LinkedList): Відсортовані списки.
+            key (callable): Функція, що обчислює ключ порівняння.
+
+        Повертає:
+            LinkedList: Новий список, що складається з вузлів вхідних списків.
+        """
+        if key is None:
+            def key(data):
+                return data
+
+        # Купа з голів списків: (ключ, номер списку, вузол); номер робить злиття стабільним
+        heap = [(key(lst.head.data), i, lst.head) for i, lst in enumerate(lists) if lst.head]
+        heapq.heapify(heap)
+
+        result = cls()
+        tail = None
+        while heap:
+            _, i, node = heap[0]
+            if node.next:
+                heapq.heapreplace(heap, (key(node.next.data), i, node.next))
+            else:
+                heapq.heappop(heap)
+            if tail:
+                tail.next = node
+            else:
+                result.head = node
+            tail = node
+
+        if tail:
+            tail.next = None
+        result.tail = tail
+        for lst in lists:
+            result.length += lst.length
+            lst.head = lst.tail = None
+            lst.length = 0
+            lst._reversed_cache = None
         return result
 
     def display(self):
@@ -88,12 +326,256 @@ class LinkedList:
             current = current.next
         return " -> ".join(elements) if elements else "Порожній"
 
+    def write(self, file, separator=" -> ", chunk_size=1024):
+        """
+        Потоково записує відображення списку у файловий об'єкт порціями,
+        не створюючи повного рядка в пам'яті.
+
+        Параметри:
+            file: Об'єкт із методом write (файл, sys.stdout, io.StringIO).
+            separator (str): Роздільник між елементами.
+            chunk_size (int): Кількість елементів в одній порції запису.
+        """
+        if not self.head:
+            file.write("Порожній")
+            return
+        chunk = []
+        prefix = ""
+        for data in self:
+            chunk.append(str(data))
+            if len(chunk) >= chunk_size:
+                file.write(prefix + separator.join(chunk))
+                chunk.clear()
+                prefix = separator
+        if chunk:
+            file.write(prefix + separator.join(chunk))
+
+    def preview(self, first=5, last=5, separator=" -> "):
+        """
+        Повертає скорочене відображення: перші first і останні last елементів.
+        Пам'ять — O(first + last) незалежно від довжини списку.
+
+        Параметри:
+            first (int): Кількість елементів з початку.
+            last (int): Кількість елементів з кінця.
+            separator (str): Роздільник між елементами.
+
+        Повертає:
+            str: Скорочене відображення списку.
+        """
+        head_part = []
+        tail_part = deque(maxlen=last)
+        count = 0
+        for data in self:
+            if count < first:
+                head_part.append(str(data))
+            elif last:
+                tail_part.append(data)
+            count += 1
+
+        if not count:
+            return "Порожній"
+        if count <= first + last:
+            return separator.join(head_part + [str(data) for data in tail_part])
+        hidden = count - first - len(tail_part)
+        parts = head_part + [f"... ({hidden} пропущено)"] + [str(data) for data in tail_part]
+        return separator.join(parts)
+
+class ArrayLinkedList:
+    """
+    Компактний однозв'язний список: дані та індекси наступних вузлів
+    зберігаються у двох паралельних масивах array замість об'єкта на вузол.
+    Сортування та злиття виконуються NumPy над поданнями цих буферів,
+    щоб не створювати Python-об'єкт на кожне значення.
+
+    Параметри:
+        typecode (str): Код типу масиву даних (за замовчуванням 'q' — цілі 64-біт).
+    """
+    __slots__ = ("typecode", "data", "next", "head", "tail", "length")
+
+    NONE = -1  # Індекс, що позначає відсутність наступного вузла
+
+    def __init__(self, typecode="q"):
+        self.typecode = typecode
+        self.data = array(typecode)
+        self.next = array("q")
+        self.head = self.NONE
+        self.tail = self.NONE
+        self.length = 0
+
+    @classmethod
+    def from_iterable(cls, iterable, typecode="q"):
+        """Створює список з елементів ітерованого об'єкта за один прохід."""
+        linked_list = cls(typecode)
+        linked_list.extend(iterable)
+        return linked_list
+
+    def _indices(self):
+        """Генерує індекси вузлів у порядку зв'язків."""
+        index = self.head
+        next_ = self.next
+        while index != self.NONE:
+            yield index
+            index = next_[index]
+
+    def _values(self):
+        """Генерує значення вузлів у порядку зв'язків."""
+        data = self.data
+        for index in self._indices():
+            yield data[index]
+
+    def append(self, data):
+        """Додає елемент у кінець списку за O(1)."""
+        index = len(self.data)
+        self.data.append(data)
+        self.next.append(self.NONE)
+        if self.head == self.NONE:
+            self.head = index
+        else:
+            self.next[self.tail] = index
+        self.tail = index
+        self.length += 1
+
+    def extend(self, iterable):
+        """Додає всі елементи ітерованого об'єкта в кінець списку."""
+        for data in iterable:
+            self.append(data)
+
+    def reverse(self):
+        """Реверсує список, змінюючи лише масив індексів."""
+        next_ = self.next
+        prev = self.NONE
+        current = self.head
+        while current != self.NONE:
+            next_index = next_[current]
+            next_[current] = prev
+            prev = current
+            current = next_index
+        self.head, self.tail = prev, self.head
+
+    def _rebuild(self, values):
+        """
+        Перезаписує буфери послідовно: вузол i посилається на i + 1.
+        values — масив NumPy; дані копіюються в типізований буфер без
+        створення Python-об'єкта на елемент.
+        """
+        self.data = array(self.typecode)
+        self.data.frombytes(values.astype(self.typecode, copy=False).tobytes())
+        self.length = len(self.data)
+        self.next = array("q")
+        self.next.frombytes(np.arange(1, self.length + 1, dtype=np.int64).tobytes())
+        if self.length:
+            self.next[-1] = self.NONE
+            self.head, self.tail = 0, self.length - 1
+        else:
+            self.head = self.tail = self.NONE
+
+    def _ordered(self):
+        """
+        Повертає значення в порядку зв'язків як масив NumPy над типізованим
+        буфером. Якщо вузли вже лежать послідовно, буфер береться без копіювання,
+        інакше збираються лише 8-байтові індекси.
+        """
+        values = np.array(self.data, copy=False) if self.data else np.empty(0, dtype=self.typecode)
+        if self.length == len(values) and (self.length == 0 or self.head == 0):
+            next_ = np.array(self.next, copy=False)
+            if np.array_equal(next_[:-1], np.arange(1, self.length)):
+                return values
+        order = array("q", self._indices())
+        return values[np.array(order, copy=False)]
+
+    def merge_sort(self):
+        """
+        Сортує список стабільним сортуванням NumPy над значеннями, зібраними
+        в порядку зв'язків, після чого буфери перебудовуються без «дірок».
+        """
+        self._rebuild(np.sort(self._ordered(), kind="stable"))
+
+    def merge_sorted_lists(self, other_list):
+        """
+        Об'єднує інший відсортований список із поточним, повертаючи новий відсортований список.
+        Як і в LinkedList.merge_sorted_lists, обидва вхідні списки після
+        злиття стають порожніми (їхні буфери звільняються).
+        """
+        result = ArrayLinkedList(self.typecode)
+        # Стабільне сортування двох відсортованих серій зливає їх за лінійний час;
+        # за рівних значень елементи поточного списку йдуть першими
+        merged = np.sort(np.concatenate((self._ordered(), other_list._ordered())), kind="stable")
+        result._rebuild(merged)
+        for lst in (self, other_list):
+            lst.data = array(lst.typecode)
+            lst.next = array("q")
+            lst.head = lst.tail = lst.NONE
+            lst.length = 0
+        return result
+
+    def display(self):
+        """Відображає елементи однозв'язного списку."""
+        elements = [str(value) for value in self._values()]
+        return " -> ".join(elements) if elements else "Порожній"
+
+def benchmark_layouts(n=100_000):
+    """
+    Порівнює пам'ять і швидкість розміщення вузлів: об'єкт із __dict__,
+    об'єкт зі __slots__ (Node) та паралельні масиви (ArrayLinkedList).
+
+    Параметри:
+        n (int): Кількість елементів.
+
+    Повертає:
+        dict: Для кожного варіанта — байти на елемент і побудованих вузлів за секунду.
+    """
+    class DictNode:
+        def __init__(self, data):
+            self.data = data
+            self.next = None
+
+    # Однаковий цикл для кожного варіанта: пряме зв'язування без викликів методів
+    def build_nodes(node_class):
+        head = tail = node_class(0)
+        for data in range(1, n):
+            tail.next = node_class(data)
+            tail = tail.next
+        return head
+
+    def build_arrays():
+        linked_list = ArrayLinkedList()
+        data_buffer, next_buffer = linked_list.data, linked_list.next
+        data_buffer.append(0)
+        next_buffer.append(ArrayLinkedList.NONE)
+        tail = 0
+        for data in range(1, n):
+            data_buffer.append(data)
+            next_buffer.append(ArrayLinkedList.NONE)
+            next_buffer[tail] = tail + 1
+            tail += 1
+        linked_list.head, linked_list.tail, linked_list.length = 0, tail, n
+        return linked_list
+
+    results = {}
+    for name, build in (("Node (__dict__)", lambda: build_nodes(DictNode)),
+                        ("Node (__slots__)", lambda: build_nodes(Node)),
+                        ("ArrayLinkedList", build_arrays)):
+        # Час і пам'ять вимірюються окремими запусками: tracemalloc сповільнює
+        # кожне виділення пам'яті й спотворив би швидкість
+        elapsed = math.inf
+        for _ in range(3):
+            start = time.perf_counter()
+            structure = build()
+            elapsed = min(elapsed, time.perf_counter() - start)
+            del structure
+        tracemalloc.start()
+        structure = build()
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del structure
+        results[name] = {"bytes_per_element": memory / n, "ops_per_sec": n / elapsed}
+    return results
+
 # Приклад використання та тестування
 if __name__ == "__main__":
     # Створюємо та заповнюємо перший список
-    list1 = LinkedList()
-    for data in [4, 2, 1, 3]:
-        list1.append(data)
+    list1 = LinkedList.from_iterable([4, 2, 1, 3])
     
     print("Початковий список 1:", list1.display())
     
@@ -104,14 +586,37 @@ if __name__ == "__main__":
     # Сортуємо список
     list1.merge_sort()
     print("Відсортований список 1:", list1.display())
+
+    # Ітеративне сортування за спаданням
+    list1.merge_sort_bottom_up(reverse=True)
+    print("Відсортований за спаданням список 1:", list1.display())
+    list1.merge_sort_bottom_up()
     
     # Створюємо та заповнюємо другий список
     list2 = LinkedList()
-    for data in [5, 0, 6]:
-        list2.append(data)
+    list2.extend([5, 0, 6])
     list2.merge_sort()  # Переконуємося, що список 2 відсортований
     print("Відсортований список 2:", list2.display())
     
     # Об'єднуємо два відсортовані списки
     merged_list = list1.merge_sorted_lists(list2)
     print("Об'єднаний відсортований список:", merged_list.display())
+
+    # K-стороннє злиття: ліниво та з повторним використанням вузлів
+    shards = [LinkedList.from_iterable(shard) for shard in ([1, 4, 7], [2, 5, 8], [0, 3, 6, 9])]
+    print("Ліниве злиття:", list(LinkedList.iter_merge_sorted(*shards, [2.5, 10])))
+    print("Злиття з переплетенням вузлів:", LinkedList.merge_k_sorted_lists(*shards).display())
+
+    # Ітерація, довжина та скорочене відображення великого списку
+    big_list = LinkedList.from_iterable(range(1_000_000))
+    print(f"Довжина: {len(big_list)}, останній елемент: {next(reversed(big_list))}")
+    print("Скорочено:", big_list.preview(first=3, last=3))
+    print("Потоковий запис: ", end="")
+    LinkedList.from_iterable(range(10)).write(sys.stdout, chunk_size=4)
+    print()
+
+    # Порівнюємо компактність представлень
+    print("\nПорівняння розміщення вузлів:")
+    for name, stats in benchmark_layouts().items():
+        print(f"{name}: {stats['bytes_per_element']:.1f} байт/елемент, "
+              f"{stats['ops_per_sec']:,.0f} вузлів/с")
\ No newline at end of file
@@ -1,7 +1,18 @@
 # Реалізація фрактала "Дерево Піфагора" з використанням Pillow і збереженням у PNG із рівнем рекурсії в імені файлу
 
+from concurrent.futures import ProcessPoolExecutor
 from PIL import Image, ImageDraw
+import argparse
+import hashlib
+import itertools
+import json
 import math
+import os
+import shutil
+import struct
+import sys
+import zlib
+import numpy as np
 
 def draw_branch(draw, x1, y1, length, angle, level, max_level, color=(0, 128, 0)):
     """
@@ -34,12 +45,403 @@ def draw_branch(draw, x1, y1, length, angle, level, max_level, color=(0, 128, 0)
     draw_branch(draw, x2, y2, new_length, angle + 45, level - 1, max_level, new_color)
     draw_branch(draw, x2, y2, new_length, angle - 45, level - 1, max_level, new_color)
 
-def main(recursion_level):
+def level_colors(max_level, color=(0, 128, 0)):
+    """
+    Обчислює кольори гілок для кожної глибини так само, як draw_branch.
+
+    Параметри:
+        max_level (int): Максимальний рівень рекурсії.
+        color (tuple): Колір стовбура у форматі RGB.
+
+    Повертає:
+        list: Колір для глибини 0..max_level-1.
+    """
+    colors = []
+    for depth in range(max_level):
+        colors.append(color)
+        level = max_level - depth
+        color = tuple(min(255, c + 20 * (max_level - level)) for c in color)
+    return colors
+
+def compute_levels(x1, y1, length, angle, max_level, bounds=None, pad=0.0):
+    """
+    Обчислює кінці всіх гілок рівень за рівнем у масивах NumPy.
+
+    Кути мають вигляд angle + 45·k, тож косинуси й синуси обчислюються
+    через math лише для 2·max_level + 1 значень і беруться з таблиці —
+    координати збігаються з draw_branch до останнього біта.
+
+    Параметри:
+        x1, y1 (float): Початкові координати стовбура.
+        length (float): Довжина стовбура.
+        angle (float): Кут нахилу стовбура (у градусах).
+        max_level (int): Кількість рівнів.
+        bounds (tuple): Прямокутник (left, top, right, bottom); гілки, чиє
+            піддерево гарантовано не перетинає його, відкидаються разом із нащадками.
+        pad (float): Запас до прямокутника (наприклад, половина товщини лінії).
+
+    Повертає:
+        generator: Для кожної глибини — кортеж масивів (x1, y1, x2, y2, index).
+            Нащадки гілки з індексом i мають індекси 2i (ліва, +45°) і 2i + 1 (права, −45°).
+    """
+    turns = np.arange(-max_level, max_level + 1)
+    cos_table = np.array([math.cos(math.radians(angle + 45 * int(k))) for k in turns])
+    sin_table = np.array([math.sin(math.radians(angle + 45 * int(k))) for k in turns])
+    scale = math.sqrt(2) / 2
+
+    xs = np.array([x1], dtype=float)
+    ys = np.array([y1], dtype=float)
+    ks = np.array([max_level], dtype=np.int64)  # Індекс у таблицях: k + max_level
+    index = np.zeros(1, dtype=np.int64)
+    for depth in range(max_level):
+        if bounds is not None:
+            # Усе піддерево лежить у квадраті з півстороною length / (1 - scale)
+            reach = length / (1 - scale) + pad
+            left, top, right, bottom = bounds
+            keep = ((xs + reach >= left) & (xs - reach <= right)
+                    & (ys + reach >= top) & (ys - reach <= bottom))
+            xs, ys, ks, index = xs[keep], ys[keep], ks[keep], index[keep]
+            if not len(xs):
+                return
+        x2 = xs + length * cos_table[ks]
+        y2 = ys - length * sin_table[ks]  # Y іде вниз у Pillow
+        yield xs, ys, x2, y2, index
+        # Кожна гілка породжує ліву (+45°) і праву (−45°) гілки
+        xs = np.repeat(x2, 2)
+        ys = np.repeat(y2, 2)
+        ks = np.column_stack((ks + 1, ks - 1)).ravel()
+        index = np.column_stack((2 * index, 2 * index + 1)).ravel()
+        length = length * scale
+
+def preorder_positions(depth, index, max_level):
+    """
+    Обчислює позиції гілок у прямому обході, яким малює draw_branch.
+
+    Ліва дитина йде одразу після батька, права — після всього лівого
+    піддерева розміром 2^(max_level - d - 1) - 1.
+
+    Параметри:
+        depth (int): Глибина гілок.
+        index (np.ndarray): Індекси гілок на цій глибині.
+        max_level (int): Максимальний рівень рекурсії.
+
+    Повертає:
+        np.ndarray: Позиції гілок у порядку малювання.
+    """
+    positions = np.full(len(index), depth, dtype=np.int64)
+    for j in range(depth):
+        turn_right = (index >> (depth - 1 - j)) & 1
+        positions += turn_right * (2 ** (max_level - j - 1) - 1)
+    return positions
+
+def draw_segments(draw, levels, max_level, color=(0, 128, 0), offset=(0, 0), width_scale=1):
+    """
+    Малює обчислені рівні гілок у порядку прямого обходу.
+
+    Параметри:
+        draw (ImageDraw.Draw): Об'єкт для малювання.
+        levels (iterable): Рівні у форматі compute_levels.
+        max_level (int): Максимальний рівень рекурсії.
+        color (tuple): Колір стовбура у форматі RGB.
+        offset (tuple): Зсув (x, y), що віднімається від координат (для плиток).
+        width_scale (float): Множник товщини ліній.
+    """
+    parts = [[], [], [], [], [], []]
+    for depth, (xs, ys, x2, y2, index) in enumerate(levels):
+        for part, values in zip(parts, (xs, ys, x2, y2)):
+            part.append(values)
+        parts[4].append(np.full(len(xs), depth, dtype=np.int8))
+        parts[5].append(preorder_positions(depth, index, max_level))
+    if not parts[0]:
+        return
+
+    order = np.argsort(np.concatenate(parts[5]), kind="stable")
+    dx, dy = offset
+    x_start = (np.concatenate(parts[0])[order] - dx).tolist()
+    y_start = (np.concatenate(parts[1])[order] - dy).tolist()
+    x_end = (np.concatenate(parts[2])[order] - dx).tolist()
+    y_end = (np.concatenate(parts[3])[order] - dy).tolist()
+    depths = np.concatenate(parts[4])[order].tolist()
+
+    colors = level_colors(max_level, color)
+    widths = [max(1, round((max_level - depth) * width_scale)) for depth in range(max_level)]
+    line = draw.line
+    for xa, ya, xb, yb, depth in zip(x_start, y_start, x_end, y_end, depths):
+        line([(xa, ya), (xb, yb)], fill=colors[depth], width=widths[depth])
+
+def draw_tree_vectorized(draw, x1, y1, length, angle, max_level, color=(0, 128, 0)):
+    """
+    Малює "Дерево Піфагора" без рекурсії: геометрія обчислюється рівнями
+    у NumPy, а відрізки малюються в тому ж порядку (прямий обхід), що й
+    у draw_branch, тому результат попіксельно збігається.
+
+    Параметри:
+        draw (ImageDraw.Draw): Об'єкт для малювання.
+        x1, y1 (float): Початкові координати стовбура.
+        length (float): Довжина стовбура.
+        angle (float): Кут нахилу стовбура (у градусах).
+        max_level (int): Максимальний рівень рекурсії.
+        color (tuple): Колір стовбура у форматі RGB.
+    """
+    levels = compute_levels(x1, y1, length, angle, max_level)
+    draw_segments(draw, levels, max_level, color)
+
+def poster_parameters(scale):
+    """
+    Повертає розмір зображення та параметри стовбура для масштабу scale
+    відносно базового полотна 800x600 із main.
+
+    Параметри:
+        scale (float): Масштаб відносно 800x600.
+
+    Повертає:
+        tuple: (width, height, start_x, start_y, initial_length).
+    """
+    width, height = round(800 * scale), round(600 * scale)
+    return width, height, width // 2, height - 50 * scale, 100 * scale
+
+def _render_tile(job):
+    """
+    Рендерить одну плитку (виконується в окремому процесі).
+
+    Геометрія обчислюється заново з відсіканням гілок за обмежувальним
+    прямокутником плитки, тож до процесу передаються лише кілька чисел.
+
+    Повертає:
+        str | bytes: Шлях до збереженої плитки або сирі RGB-байти.
+    """
+    recursion_level, scale, color, left, top, tile_width, tile_height, path = job
+    _, _, start_x, start_y, initial_length = poster_parameters(scale)
+    image = Image.new("RGB", (tile_width, tile_height), "white")
+    draw = ImageDraw.Draw(image)
+
+    pad = max(1, recursion_level * scale) / 2 + 1  # Половина найтовщої лінії
+    bounds = (left, top, left + tile_width, top + tile_height)
+    levels = compute_levels(start_x, start_y, initial_length, 90, recursion_level, bounds, pad)
+    draw_segments(draw, levels, recursion_level, color, offset=(left, top), width_scale=scale)
+
+    if path is None:
+        return image.tobytes()
+    image.save(path, "PNG")
+    return path
+
+def _png_chunk(file, kind, data):
+    """Записує один блок PNG: довжина, тип, дані та CRC."""
+    file.write(struct.pack(">I", len(data)))
+    file.write(kind)
+    file.write(data)
+    file.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+def render_tiled(recursion_level, scale=1.0, tile_size=1024, output=None, mode="tiles",
+                 workers=None, color=(0, 128, 0)):
+    """
+    Рендерить "Дерево Піфагора" великого розміру плитками в пулі процесів.
+
+    Повне зображення ніколи не створюється в пам'яті:
+      - mode="tiles": кожна плитка зберігається окремим PNG у каталозі output,
+        поруч записується index.json з їхнім розташуванням; пікова пам'ять —
+        одна плитка на процес;
+      - mode="png": плитки одного ряду склеюються й потоково записуються
+        в один PNG рядок за рядком; пікова пам'ять — один ряд плиток
+        (ширина × tile_size пікселів).
+    Товсті лінії, що перетинають межу плитки, Pillow растеризує окремо
+    в кожній плитці, тож уздовж швів можливі поодинокі розбіжні пікселі.
+
+    Параметри:
+        recursion_level (int): Рівень рекурсії.
+        scale (float): Масштаб відносно полотна 800x600 (наприклад, 37.5 для 30000x22500).
+        tile_size (int): Сторона плитки в пікселях.
+        output (str): Каталог плиток або шлях до PNG.
+        mode (str): "tiles" або "png".
+        workers (int): Кількість процесів (за замовчуванням — кількість ядер).
+        color (tuple): Колір стовбура у форматі RGB.
+
+    Повертає:
+        str: Шлях до каталогу плиток або до PNG-файлу.
+    """
+    width, height, _, _, _ = poster_parameters(scale)
+    columns = range(0, width, tile_size)
+    rows = range(0, height, tile_size)
+
+    def row_jobs(top, directory=None):
+        tile_height = min(tile_size, height - top)
+        jobs = []
+        for left in columns:
+            tile_width = min(tile_size, width - left)
+            path = None
+            if directory is not None:
+                path = os.path.join(directory, f"tile_{top // tile_size}_{left // tile_size}.png")
+            jobs.append((recursion_level, scale, color, left, top, tile_width, tile_height, path))
+        return jobs
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if mode == "tiles":
+            output = output or f"pythagoras_tree_level_{recursion_level}_tiles"
+            os.makedirs(output, exist_ok=True)
+            jobs = [job for top in rows for job in row_jobs(top, output)]
+            tiles = []
+            for job, path in zip(jobs, executor.map(_render_tile, jobs)):
+                _, _, _, left, top, tile_width, tile_height, _ = job
+                tiles.append({"file": os.path.basename(path), "left": left, "top": top,
+                              "width": tile_width, "height": tile_height})
+            index = {"width": width, "height": height, "tile_size": tile_size,
+                     "level": recursion_level, "scale": scale, "tiles": tiles}
+            with open(os.path.join(output, "index.json"), "w", encoding="utf-8") as file:
+                json.dump(index, file, indent=2)
+        elif mode == "png":
+            output = output or f"pythagoras_tree_level_{recursion_level}_poster.png"
+            compressor = zlib.compressobj(6)
+            with open(output, "wb") as file:
+                file.write(b"\x89PNG\r\n\x1a\n")
+                _png_chunk(file, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+                for top in rows:
+                    jobs = row_jobs(top)
+                    band = list(executor.map(_render_tile, jobs))
+                    strides = [job[5] * 3 for job in jobs]
+                    for y in range(jobs[0][6]):
+                        # Кожен рядок PNG починається з байта фільтра (0 — без фільтра)
+                        row = b"\x00" + b"".join(
+                            tile[y * stride:(y + 1) * stride] for tile, stride in zip(band, strides)
+                        )
+                        data = compressor.compress(row)
+                        if data:
+                            _png_chunk(file, b"IDAT", data)
+                    del band
+                _png_chunk(file, b"IDAT", compressor.flush())
+                _png_chunk(file, b"IEND", b"")
+        else:
+            raise ValueError(f"Невідомий режим виводу: {mode}")
+
+    print(f"Фрактал збережено у: {output}")
+    return output
+
+CACHE_VERSION = 1  # Змінюється разом з алгоритмом рендерингу, щоб знецінити кеш
+
+def cache_key(level, width, height, length, angle, color):
+    """
+    Обчислює ключ кешу за параметрами рендерингу.
+
+    Повертає:
+        str: SHA-256 канонічного JSON-подання параметрів.
+    """
+    params = {"level": level, "width": width, "height": height, "length": float(length),
+              "angle": float(angle), "color": list(color), "version": CACHE_VERSION}
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+def _render_parameter_set(job):
+    """
+    Рендерить усі відсутні в кеші рівні для одного набору параметрів
+    (виконується в окремому процесі).
+
+    Геометрія обчислюється один раз до найбільшого рівня: рівень n
+    використовує перші n рівнів масивів, тож рівень n + 1 лише додає
+    один новий рівень до вже обчисленої геометрії рівня n.
+
+    Повертає:
+        list: Шляхи до збережених файлів.
+    """
+    (width, height, length, angle, color), levels, cache_dir = job
+    start_x, start_y = width // 2, height - 50
+    geometry = list(compute_levels(start_x, start_y, length, angle, max(levels)))
+
+    paths = []
+    for level in levels:
+        image = Image.new("RGB", (width, height), "white")
+        draw_segments(ImageDraw.Draw(image), geometry[:level], level, color)
+        path = os.path.join(cache_dir, cache_key(level, width, height, length, angle, color) + ".png")
+        # Записуємо через тимчасовий файл, щоб у кеші не було недописаних зображень
+        image.save(path + ".tmp", "PNG")
+        os.replace(path + ".tmp", path)
+        paths.append(path)
+    return paths
+
+def render_batch(levels, sizes=((800, 600),), lengths=(100,), angles=(90,),
+                 colors=((0, 128, 0),), cache_dir=".pythagoras_cache", workers=None):
+    """
+    Неінтерактивно рендерить серію рівнів для всіх комбінацій параметрів
+    у пулі процесів із кешем на диску, адресованим за параметрами.
+
+    Параметри:
+        levels (iterable): Рівні рекурсії.
+        sizes (iterable): Розміри полотна (width, height).
+        lengths (iterable): Довжини стовбура.
+        angles (iterable): Початкові кути (у градусах).
+        colors (iterable): Кольори стовбура у форматі RGB.
+        cache_dir (str): Каталог кешу.
+        workers (int): Кількість процесів (за замовчуванням — кількість ядер).
+
+    Повертає:
+        dict: (level, width, height, length, angle, color) -> шлях до PNG у кеші.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    levels = sorted(set(levels))
+    results = {}
+    jobs = []
+    for (width, height), length, angle, color in itertools.product(sizes, lengths, angles, colors):
+        color = tuple(color)
+        pending = []
+        for level in levels:
+            path = os.path.join(cache_dir, cache_key(level, width, height, length, angle, color) + ".png")
+            results[(level, width, height, length, angle, color)] = path
+            if not os.path.exists(path):
+                pending.append(level)
+        if pending:
+            jobs.append(((width, height, length, angle, color), pending, cache_dir))
+
+    rendered = sum(len(job[1]) for job in jobs)
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(_render_parameter_set, jobs):
+                pass
+    print(f"Відрендерено: {rendered}, взято з кешу: {len(results) - rendered}")
+    return results
+
+def parse_args(argv):
+    """Розбирає аргументи командного рядка для пакетного рендерингу."""
+    def level_range(value):
+        start, _, end = value.partition("-")
+        return list(range(int(start), int(end or start) + 1))
+
+    def size(value):
+        width, height = value.lower().split("x")
+        return int(width), int(height)
+
+    def rgb(value):
+        return tuple(int(c) for c in value.split(","))
+
+    parser = argparse.ArgumentParser(description="Пакетний рендеринг фрактала \"Дерево Піфагора\".")
+    parser.add_argument("--levels", type=level_range, default=[5], help="Рівні, наприклад 1-12")
+    parser.add_argument("--size", type=size, nargs="+", default=[(800, 600)], help="Розміри, наприклад 800x600")
+    parser.add_argument("--length", type=float, nargs="+", default=[100], help="Довжини стовбура")
+    parser.add_argument("--angle", type=float, nargs="+", default=[90], help="Початкові кути")
+    parser.add_argument("--color", type=rgb, nargs="+", default=[(0, 128, 0)], help="Кольори, наприклад 0,128,0")
+    parser.add_argument("--cache-dir", default=".pythagoras_cache", help="Каталог кешу")
+    parser.add_argument("--output-dir", default=".", help="Каталог для іменованих копій зображень")
+    parser.add_argument("--workers", type=int, default=None, help="Кількість процесів")
+    return parser.parse_args(argv)
+
+def batch_main(argv):
+    """Запускає пакетний рендеринг і копіює результати з кешу під зрозумілими іменами."""
+    args = parse_args(argv)
+    results = render_batch(args.levels, args.size, args.length, args.angle, args.color,
+                           args.cache_dir, args.workers)
+    os.makedirs(args.output_dir, exist_ok=True)
+    single_set = len(results) == len(set(args.levels))
+    for (level, width, height, length, angle, color), path in results.items():
+        if single_set:
+            name = f"pythagoras_tree_level_{level}.png"
+        else:
+            hex_color = "".join(f"{c:02x}" for c in color)
+            name = f"pythagoras_tree_{width}x{height}_l{length:g}_a{angle:g}_{hex_color}_level_{level}.png"
+        shutil.copyfile(path, os.path.join(args.output_dir, name))
+
+def main(recursion_level, vectorized=False):
     """
     Створює та зберігає фрактал "Дерево Піфагора" у PNG із рівнем рекурсії в імені файлу.
     
     Параметри:
         recursion_level (int): Рівень рекурсії.
+        vectorized (bool): Використати векторизований рендерер NumPy.
     """
     # Налаштування зображення
     width, height = 800, 600
@@ -53,7 +455,10 @@ def main(recursion_level):
     initial_angle = 90  # Вгору
     
     # Малюємо фрактал
-    draw_branch(draw, start_x, start_y, initial_length, initial_angle, recursion_level, recursion_level)
+    if vectorized:
+        draw_tree_vectorized(draw, start_x, start_y, initial_length, initial_angle, recursion_level)
+    else:
+        draw_branch(draw, start_x, start_y, initial_length, initial_angle, recursion_level, recursion_level)
     
     # Формуємо ім'я файлу з рівнем рекурсії
     output_file = f"pythagoras_tree_level_{recursion_level}.png"
@@ -62,18 +467,23 @@ def main(recursion_level):
     image.save(output_file, "PNG")
     print(f"Фрактал збережено у файл: {output_file}")
 
-if __name__ == "__main__":
+if __name__ == "__main__" and len(sys.argv) > 1:
+    # Пакетний режим: python task2.py --levels 1-12 --size 800x600 1600x1200
+    batch_main(sys.argv[1:])
+elif __name__ == "__main__":
     # Отримання рівня рекурсії від користувача
     try:
         level = int(input("Введіть рівень рекурсії (рекомендується 1-10): "))
         if level < 0:
             print("Рівень рекурсії не може бути від'ємним. Встановлено 5.")
             level = 5
-        elif level > 12:
-            print("Занадто великий рівень може бути повільним. Встановлено 10.")
-            level = 10
+        elif level > 20:
+            # Рівень 20 — близько 3 с і 260 МБ; кожен наступний подвоює обидва
+            print("Занадто великий рівень потребує забагато пам'яті (для більших — render_tiled). Встановлено 20.")
+            level = 20
     except ValueError:
         print("Некоректне введення. Встановлено рівень 5.")
         level = 5
     
-    main(level)
\ No newline at end of file
+    # Великі рівні малюємо векторизованим рендерером
+    main(level, vectorized=level > 12)
\ No newline at end of file
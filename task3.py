@@ -1,30 +1,397 @@
 # Реалізація алгоритму Дейкстри з використанням бінарної купи для зваженого графа
 
 import heapq
+from array import array
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import itertools
 import math
+import mmap
+import os
+import pickle
+import random
+import tempfile
+import time
+import weakref
+import numpy as np
+
+class LazyHeap:
+    """
+    Черга з лінивим видаленням на основі heapq, як у Graph.dijkstra: кожне
+    оновлення додає новий запис, а застарілі пропускаються під час pop.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.best = {}
+        self.peak_size = 0
+
+    def __len__(self):
+        return len(self.best)
+
+    def update(self, item, priority):
+        """Додає елемент або знижує його пріоритет."""
+        self.best[item] = priority
+        heapq.heappush(self.heap, (priority, item))
+        self.peak_size = max(self.peak_size, len(self.heap))
+
+    def pop(self):
+        """Вилучає елемент із найменшим пріоритетом; повертає (пріоритет, елемент)."""
+        while True:
+            priority, item = heapq.heappop(self.heap)
+            if self.best.get(item) == priority:
+                del self.best[item]
+                return priority, item
+
+class IndexedHeap:
+    """
+    Індексована бінарна купа зі справжнім decrease-key: кожен елемент
+    зберігається один раз, а словник позицій дозволяє просіяти його вгору
+    за O(log n) замість додавання дубліката.
+    """
+
+    def __init__(self):
+        self.heap = []       # Записи (пріоритет, елемент)
+        self.position = {}   # Елемент -> індекс у heap
+        self.peak_size = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def update(self, item, priority):
+        """Додає елемент або знижує його пріоритет."""
+        if item in self.position:
+            index = self.position[item]
+            if priority >= self.heap[index][0]:
+                return
+            self.heap[index] = (priority, item)
+        else:
+            index = len(self.heap)
+            self.heap.append((priority, item))
+            self.peak_size = max(self.peak_size, len(self.heap))
+        self._sift_up(index)
+
+    def pop(self):
+        """Вилучає елемент із найменшим пріоритетом; повертає (пріоритет, елемент)."""
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        del self.position[top[1]]
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        return top
+
+    def _sift_up(self, index):
+        heap, position = self.heap, self.position
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) // 2
+            if heap[parent] <= entry:
+                break
+            heap[index] = heap[parent]
+            position[heap[index][1]] = index
+            index = parent
+        heap[index] = entry
+        position[entry[1]] = index
+
+    def _sift_down(self, index):
+        heap, position = self.heap, self.position
+        size = len(heap)
+        entry = heap[index]
+        while True:
+            child = 2 * index + 1
+            if child >= size:
+                break
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if entry <= heap[child]:
+                break
+            heap[index] = heap[child]
+            position[heap[index][1]] = index
+            index = child
+        heap[index] = entry
+        position[entry[1]] = index
+
+class _PairingNode:
+    __slots__ = ("key", "item", "child", "sibling", "prev")
+
+    def __init__(self, key, item):
+        self.key = key        # (пріоритет, елемент) — для того ж порядку, що й у heapq
+        self.item = item
+        self.child = None
+        self.sibling = None
+        self.prev = None      # Попередній брат або батько
+
+class PairingHeap:
+    """
+    Парна купа: decrease-key за амортизовані O(1) (вирізання піддерева та
+    злиття з коренем), pop — двопрохідне злиття дітей кореня.
+    """
 
-class Graph:
     def __init__(self):
-        """Ініціалізує граф як список суміжності."""
+        self.root = None
+        self.nodes = {}
+        self.peak_size = 0
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def _meld(self, a, b):
+        """Зливає два корені: більший стає першою дитиною меншого."""
+        if b.key < a.key:
+            a, b = b, a
+        b.prev = a
+        b.sibling = a.child
+        if a.child:
+            a.child.prev = b
+        a.child = b
+        a.sibling = a.prev = None
+        return a
+
+    def update(self, item, priority):
+        """Додає елемент або знижує його пріоритет."""
+        node = self.nodes.get(item)
+        if node is None:
+            node = self.nodes[item] = _PairingNode((priority, item), item)
+            self.peak_size = max(self.peak_size, len(self.nodes))
+            self.root = node if self.root is None else self._meld(self.root, node)
+            return
+        if (priority, item) >= node.key:
+            return
+        node.key = (priority, item)
+        if node is self.root:
+            return
+        # Вирізаємо піддерево вузла і зливаємо його з коренем
+        if node.prev.child is node:
+            node.prev.child = node.sibling
+        else:
+            node.prev.sibling = node.sibling
+        if node.sibling:
+            node.sibling.prev = node.prev
+        node.sibling = node.prev = None
+        self.root = self._meld(self.root, node)
+
+    def pop(self):
+        """Вилучає елемент із найменшим пріоритетом; повертає (пріоритет, елемент)."""
+        root = self.root
+        del self.nodes[root.item]
+
+        # Перший прохід: зливаємо дітей попарно зліва направо
+        pairs = []
+        child = root.child
+        while child:
+            first, second = child, child.sibling
+            child = second.sibling if second else None
+            first.sibling = first.prev = None
+            if second:
+                second.sibling = second.prev = None
+                first = self._meld(first, second)
+            pairs.append(first)
+
+        # Другий прохід: зливаємо пари справа наліво
+        new_root = pairs.pop() if pairs else None
+        while pairs:
+            new_root = self._meld(pairs.pop(), new_root)
+        self.root = new_root
+        return root.key
+
+class DialQueue:
+    """
+    Черга Діала (відра) для невід'ємних цілих ваг, не більших за max_weight.
+    Усі активні пріоритети лежать у вікні [current, current + max_weight],
+    тож достатньо max_weight + 1 циклічних відер; операції — O(1)
+    амортизовано. Елементи з однаковим пріоритетом виходять у порядку FIFO.
+    """
+
+    def __init__(self, max_weight):
+        self.size = max_weight + 1
+        self.buckets = [{} for _ in range(self.size)]
+        self.priority = {}
+        self.current = 0
+        self.peak_size = 0
+
+    def __len__(self):
+        return len(self.priority)
+
+    def update(self, item, priority):
+        """Додає елемент або знижує його пріоритет."""
+        old = self.priority.get(item)
+        if old is not None:
+            if priority >= old:
+                return
+            del self.buckets[old % self.size][item]
+        self.priority[item] = priority
+        self.buckets[priority % self.size][item] = None
+        self.peak_size = max(self.peak_size, len(self.priority))
+
+    def pop(self):
+        """Вилучає елемент із найменшим пріоритетом; повертає (пріоритет, елемент)."""
+        while not self.buckets[self.current % self.size]:
+            self.current += 1
+        bucket = self.buckets[self.current % self.size]
+        item = next(iter(bucket))
+        del bucket[item]
+        return self.priority.pop(item), item
+
+QUEUES = {
+    "lazy": LazyHeap,
+    "indexed": IndexedHeap,
+    "pairing": PairingHeap,
+    "dial": DialQueue,
+}
+
+class Graph:
+    def __init__(self, directed=False, dedup=None):
+        """
+        Ініціалізує граф як список суміжності.
+
+        Параметри:
+            directed (bool): Орієнтований граф — add_edge додає лише дугу u -> v.
+            dedup (str): Політика паралельних ребер: None — додавати всі,
+                "min" — зберігати одне ребро з найменшою вагою.
+        """
+        if dedup not in (None, "min"):
+            raise ValueError(f"Невідома політика дедуплікації: {dedup}")
+        self.directed = directed
+        self.dedup = dedup
         self.graph = defaultdict(list)
+        # Вхідні дуги: для неорієнтованого графа збігаються з вихідними
+        self.reverse = defaultdict(list) if directed else self.graph
+        # (u, v) -> позиція дуги у списку суміжності u, лише для dedup="min"
+        self._positions = {} if dedup else None
+        self._reverse_positions = {} if dedup and directed else self._positions
+        self.version = 0  # Зростає з кожною зміною ребер
+        self._trees = weakref.WeakSet()  # Прив'язані ShortestPathTree
 
     def add_edge(self, u, v, weight):
         """Додає ребро з вагою між вершинами u і v."""
-        self.graph[u].append((v, weight))
-        self.graph[v].append((u, weight))  # Для неорієнтованого графа
+        if self.dedup is None and not self.directed:
+            self.graph[u].append((v, weight))
+            self.graph[v].append((u, weight))  # Для неорієнтованого графа
+        else:
+            self._add_arc(self.graph, self._positions, u, v, weight)
+            self._add_arc(self.reverse, self._reverse_positions, v, u, weight)
+            self._register(u, v)
+        self._edge_changed(u, v)
 
-    def dijkstra(self, start):
+    def add_edges(self, edges):
+        """
+        Додає багато ребер за один виклик, без накладних витрат add_edge на кожне.
+
+        Параметри:
+            edges (iterable): Трійки (u, v, weight).
+        """
+        graph, reverse = self.graph, self.reverse
+        directed = self.directed
+        count = 0
+        if self.dedup is None:
+            for u, v, weight in edges:
+                graph[u].append((v, weight))
+                reverse[v].append((u, weight))
+                if directed:
+                    # Кожна вершина має бути ключем в обох списках суміжності;
+                    # реєструємо лише кінці поточних ребер, а не весь граф
+                    reverse[u]
+                    graph[v]
+                count += 1
+        else:
+            add_arc = self._add_arc
+            positions, reverse_positions = self._positions, self._reverse_positions
+            for u, v, weight in edges:
+                add_arc(graph, positions, u, v, weight)
+                add_arc(reverse, reverse_positions, v, u, weight)
+                if directed:
+                    reverse[u]
+                    graph[v]
+                count += 1
+        # Дерева найкоротших шляхів не відстежують масові зміни — вони стають застарілими
+        self.version += count
+        for tree in self._trees:
+            tree.invalidate()
+
+    @staticmethod
+    def _add_arc(adjacency, positions, u, v, weight):
+        """Додає дугу u -> v; за наявності positions лишає лише найлегшу паралельну дугу."""
+        edges = adjacency[u]
+        if positions is None:
+            edges.append((v, weight))
+            return
+        position = positions.get((u, v))
+        if position is None:
+            positions[(u, v)] = len(edges)
+            edges.append((v, weight))
+        elif weight < edges[position][1]:
+            edges[position] = (v, weight)
+
+    @staticmethod
+    def _set_arc(adjacency, positions, u, v, weight):
+        """Замінює всі дуги u -> v однією дугою з вагою weight."""
+        edges = [(x, w) for x, w in adjacency[u] if x != v] + [(v, weight)]
+        adjacency[u] = edges
+        if positions is not None:
+            for position, (x, _) in enumerate(edges):
+                positions[(u, x)] = position
+
+    def update_edge(self, u, v, weight):
+        """Встановлює нову вагу ребра між u і v (паралельні ребра замінюються одним)."""
+        self._set_arc(self.graph, self._positions, u, v, weight)
+        if self.directed or u != v:
+            self._set_arc(self.reverse, self._reverse_positions, v, u, weight)
+        self._register(u, v)
+        self._edge_changed(u, v)
+
+    def _register(self, u, v):
+        """Робить обидві вершини ключами обох списків суміжності, навіть без дуг."""
+        self.graph[v]
+        self.reverse[u]
+
+    def reversed_view(self):
+        """
+        Повертає граф із оберненими дугами, що спільно використовує списки
+        суміжності з поточним (без копіювання).
+        """
+        view = Graph(directed=self.directed)
+        view.graph, view.reverse = self.reverse, self.graph
+        return view
+
+    def _edge_changed(self, u, v):
+        """Збільшує версію графа і передає зміну прив'язаним деревам."""
+        self.version += 1
+        for tree in self._trees:
+            tree.pending.append((u, v))
+
+    def shortest_path_tree(self, start):
+        """
+        Створює кешоване дерево найкоротших шляхів, яке інкрементно
+        оновлюється при змінах ребер графа.
+
+        Параметри:
+            start: Початкова вершина.
+
+        Повертає:
+            ShortestPathTree: Дерево з distances, predecessors і get_path.
+        """
+        return ShortestPathTree(self, start)
+
+    def dijkstra(self, start, queue=None):
         """
         Реалізує алгоритм Дейкстри для знаходження найкоротших шляхів.
         
         Параметри:
             start: Початкова вершина.
+            queue (str | object): Черга з пріоритетами: "lazy", "indexed",
+                "pairing", "dial" (цілі ваги) або готовий об'єкт черги з
+                методами update/pop. За замовчуванням — купа heapq з лінивим видаленням.
         
         Повертає:
             distances: Словник із найкоротшими відстанями до кожної вершини.
             predecessors: Словник із попередниками для відновлення шляхів.
         """
+        if queue is not None:
+            return self._dijkstra_with_queue(start, queue)
+
         # Ініціалізація відстаней і попередників
         distances = {vertex: math.inf for vertex in self.graph}
         distances[start] = 0
@@ -58,6 +425,38 @@ class Graph:
         
         return distances, predecessors
 
+    def _dijkstra_with_queue(self, start, queue):
+        """Алгоритм Дейкстри з підключуваною чергою, що підтримує decrease-key."""
+        if isinstance(queue, str):
+            if queue == "dial":
+                max_weight = max((w for edges in self.graph.values() for _, w in edges), default=0)
+                if not all(isinstance(w, int) and w >= 0 for edges in self.graph.values() for _, w in edges):
+                    raise ValueError("Черга Діала потребує невід'ємних цілих ваг")
+                queue = DialQueue(max_weight)
+            else:
+                queue = QUEUES[queue]()
+
+        distances = {vertex: math.inf for vertex in self.graph}
+        distances[start] = 0
+        predecessors = {vertex: None for vertex in self.graph}
+        visited = set()
+
+        queue.update(start, 0)
+        while queue:
+            current_distance, current_vertex = queue.pop()
+            visited.add(current_vertex)
+
+            for neighbor, weight in self.graph[current_vertex]:
+                if neighbor in visited:
+                    continue
+                distance = current_distance + weight
+                if distance < distances[neighbor]:
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current_vertex
+                    queue.update(neighbor, distance)
+
+        return distances, predecessors
+
     def get_path(self, predecessors, end):
         """Відновлює шлях від початкової вершини до кінцевої за попередниками."""
         path = []
@@ -67,6 +466,899 @@ class Graph:
             current = predecessors[current]
         return path[::-1]  # Перевертаємо шлях
 
+    def shortest_path(self, start, target, bidirectional=False):
+        """
+        Знаходить найкоротший шлях між двома вершинами з раннім виходом.
+
+        На відміну від dijkstra, стан (відстані, попередники) створюється лише
+        для досягнутих вершин, а пошук зупиняється, щойно target оброблено,
+        тож вартість запиту залежить від дослідженої області, а не від розміру графа.
+
+        Параметри:
+            start: Початкова вершина.
+            target: Кінцева вершина.
+            bidirectional (bool): Шукати одночасно від обох кінців.
+
+        Повертає:
+            tuple: (відстань, шлях); для недосяжної вершини — (math.inf, []).
+        """
+        if start == target:
+            return 0, [start]
+        if bidirectional:
+            return self._bidirectional_search(start, target)
+
+        distances = {start: 0}
+        predecessors = {start: None}
+        visited = set()
+        pq = [(0, start)]
+
+        while pq:
+            current_distance, current_vertex = heapq.heappop(pq)
+            if current_vertex in visited:
+                continue
+            if current_vertex == target:
+                return current_distance, self.get_path(predecessors, target)
+            visited.add(current_vertex)
+
+            for neighbor, weight in self.graph.get(current_vertex, ()):
+                if neighbor in visited:
+                    continue
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, math.inf):
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current_vertex
+                    heapq.heappush(pq, (distance, neighbor))
+
+        return math.inf, []
+
+    def _bidirectional_search(self, start, target):
+        """
+        Двонаправлений Дейкстра: по черзі розширює менший фронт і зупиняється,
+        коли сума мінімумів обох черг не менша за найкращий знайдений шлях.
+        """
+        # Індекс 0 — прямий пошук від start, 1 — зворотний від target
+        distances = ({start: 0}, {target: 0})
+        predecessors = ({start: None}, {target: None})
+        visited = (set(), set())
+        queues = ([(0, start)], [(0, target)])
+        best, meeting = math.inf, None
+
+        while queues[0] and queues[1]:
+            if queues[0][0][0] + queues[1][0][0] >= best:
+                break
+            side = 0 if len(queues[0]) <= len(queues[1]) else 1
+            current_distance, current_vertex = heapq.heappop(queues[side])
+            if current_vertex in visited[side]:
+                continue
+            visited[side].add(current_vertex)
+            other_distances = distances[1 - side]
+
+            adjacency = self.graph if side == 0 else self.reverse
+            for neighbor, weight in adjacency.get(current_vertex, ()):
+                distance = current_distance + weight
+                # Ребро, що з'єднує два фронти, дає кандидата на найкращий шлях
+                if neighbor in other_distances and distance + other_distances[neighbor] < best:
+                    best = distance + other_distances[neighbor]
+                    meeting = (current_vertex, neighbor) if side == 0 else (neighbor, current_vertex)
+                if neighbor in visited[side]:
+                    continue
+                if distance < distances[side].get(neighbor, math.inf):
+                    distances[side][neighbor] = distance
+                    predecessors[side][neighbor] = current_vertex
+                    heapq.heappush(queues[side], (distance, neighbor))
+
+        if meeting is None:
+            return math.inf, []
+        forward_end, backward_start = meeting
+        path = self.get_path(predecessors[0], forward_end)
+        path += self.get_path(predecessors[1], backward_start)[::-1]
+        return best, path
+
+    def astar(self, start, target, heuristic=None, stats=None):
+        """
+        Алгоритм A*: Дейкстра, що впорядковує вершини за g(v) + h(v, target).
+
+        Евристика має бути допустимою й узгодженою (не переоцінювати відстань),
+        наприклад Landmarks.heuristic або euclidean_heuristic. Без евристики
+        пошук збігається з shortest_path.
+
+        Параметри:
+            start: Початкова вершина.
+            target: Кінцева вершина.
+            heuristic (callable): Функція h(vertex, target) — нижня оцінка відстані.
+            stats (dict): Якщо передано, сюди записується кількість оброблених вершин ("settled").
+
+        Повертає:
+            tuple: (відстань, шлях); для недосяжної вершини — (math.inf, []).
+        """
+        estimates = {}
+
+        def estimate(vertex):
+            if heuristic is None:
+                return 0
+            if vertex not in estimates:
+                estimates[vertex] = heuristic(vertex, target)
+            return estimates[vertex]
+
+        distances = {start: 0}
+        predecessors = {start: None}
+        visited = set()
+        pq = [(estimate(start), start)]
+        result = (math.inf, [])
+
+        while pq:
+            _, current_vertex = heapq.heappop(pq)
+            if current_vertex in visited:
+                continue
+            if current_vertex == target:
+                result = (distances[target], self.get_path(predecessors, target))
+                break
+            visited.add(current_vertex)
+            current_distance = distances[current_vertex]
+
+            for neighbor, weight in self.graph.get(current_vertex, ()):
+                if neighbor in visited:
+                    continue
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, math.inf):
+                    bound = estimate(neighbor)
+                    if bound == math.inf:
+                        continue  # Вершина гарантовано не веде до target
+                    distances[neighbor] = distance
+                    predecessors[neighbor] = current_vertex
+                    heapq.heappush(pq, (distance + bound, neighbor))
+
+        if stats is not None:
+            stats["settled"] = len(visited) + (1 if result[1] else 0)
+        return result
+
+    def freeze(self):
+        """
+        Перетворює граф на компактне незмінне подання CSR (compressed sparse row).
+
+        Повертає:
+            CSRGraph: Граф з тими самими вершинами, ребрами та результатами dijkstra.
+        """
+        return CSRGraph(self)
+
+class ShortestPathTree:
+    """
+    Кешоване дерево найкоротших шляхів від однієї вершини, прив'язане до графа.
+
+    Граф повідомляє дерево про кожну зміну ребра, а дерево лагодить себе
+    інкрементно під час наступного звернення до distances/predecessors:
+      - зменшення ваги або нове ребро — Дейкстра лише від вершин, що покращились;
+      - збільшення ваги ребра дерева — перерахунок лише піддерева під цим ребром.
+    """
+
+    def __init__(self, graph, start):
+        """
+        Параметри:
+            graph (Graph): Граф.
+            start: Початкова вершина.
+        """
+        self.graph = graph
+        self.start = start
+        self._build()
+        graph._trees.add(self)
+
+    def _build(self):
+        """Обчислює дерево з нуля."""
+        self._distances, self._predecessors = self.graph.dijkstra(self.start)
+        self.children = defaultdict(set)
+        for vertex, parent in self._predecessors.items():
+            if parent is not None:
+                self.children[parent].add(vertex)
+        self.version = self.graph.version
+        self.pending = []
+        self.needs_rebuild = False
+
+    def invalidate(self):
+        """Позначає дерево для повного перерахунку (після масових змін графа)."""
+        self.pending = []
+        self.needs_rebuild = True
+
+    @property
+    def is_stale(self):
+        """Чи змінився граф після останнього оновлення дерева."""
+        return self.version != self.graph.version
+
+    @property
+    def distances(self):
+        """Словник найкоротших відстаней (як у Graph.dijkstra)."""
+        self.refresh()
+        return self._distances
+
+    @property
+    def predecessors(self):
+        """Словник попередників (як у Graph.dijkstra)."""
+        self.refresh()
+        return self._predecessors
+
+    def get_path(self, end):
+        """Відновлює шлях від початкової вершини до end."""
+        return self.graph.get_path(self.predecessors, end)
+
+    def refresh(self):
+        """Застосовує накопичені зміни графа до дерева."""
+        if self.needs_rebuild:
+            self._build()
+            return
+        pending, self.pending = self.pending, []
+        # Нові вершини з'являються лише разом зі зміненими ребрами
+        for edge in pending:
+            for vertex in edge:
+                if vertex not in self._distances:
+                    self._distances[vertex] = math.inf
+                    self._predecessors[vertex] = None
+        for u, v in pending:
+            self._repair(u, v)
+            if not self.graph.directed:
+                self._repair(v, u)  # Неорієнтоване ребро — дві дуги
+        self.version = self.graph.version
+
+    def _repair(self, u, v):
+        """Оновлює дерево після зміни ваги дуги u -> v."""
+        distances, predecessors = self._distances, self._predecessors
+        weight = min((w for neighbor, w in self.graph.graph.get(u, ()) if neighbor == v), default=math.inf)
+
+        if distances[u] + weight < distances[v]:
+            self._set_parent(v, u, distances[u] + weight)
+            self._propagate([(distances[v], v)])
+        elif predecessors[v] == u and distances[u] + weight > distances[v]:
+            self._rebuild_subtree(v)
+
+    def _set_parent(self, vertex, parent, distance):
+        """Перевішує вершину в дереві на нового батька."""
+        old_parent = self._predecessors[vertex]
+        if old_parent is not None:
+            self.children[old_parent].discard(vertex)
+        self._predecessors[vertex] = parent
+        self._distances[vertex] = distance
+        if parent is not None:
+            self.children[parent].add(vertex)
+
+    def _propagate(self, pq):
+        """Дейкстра від вершин, чиї відстані зменшились; зачіпає лише покращені вершини."""
+        distances = self._distances
+        heapq.heapify(pq)
+        while pq:
+            current_distance, current_vertex = heapq.heappop(pq)
+            if current_distance > distances[current_vertex]:
+                continue
+            for neighbor, weight in self.graph.graph.get(current_vertex, ()):
+                distance = current_distance + weight
+                if distance < distances.get(neighbor, math.inf):
+                    self._set_parent(neighbor, current_vertex, distance)
+                    heapq.heappush(pq, (distance, neighbor))
+
+    def _rebuild_subtree(self, root):
+        """Перераховує відстані піддерева, що висіло на подовженому ребрі."""
+        affected = []
+        stack = [root]
+        while stack:
+            vertex = stack.pop()
+            affected.append(vertex)
+            stack.extend(self.children.pop(vertex, ()))
+        affected_set = set(affected)
+
+        for vertex in affected:
+            self._set_parent(vertex, None, math.inf)
+        # Найкращий вхід у кожну вершину ззовні піддерева
+        pq = []
+        distances = self._distances
+        for vertex in affected:
+            best, parent = math.inf, None
+            for neighbor, weight in self.graph.reverse.get(vertex, ()):
+                if neighbor not in affected_set and distances[neighbor] + weight < best:
+                    best, parent = distances[neighbor] + weight, neighbor
+            if parent is not None:
+                self._set_parent(vertex, parent, best)
+                pq.append((best, vertex))
+        self._propagate(pq)
+
+class CSRGraph:
+    """
+    Незмінний граф у форматі CSR: вершини пронумеровано цілими числами,
+    а суміжність зберігається в трьох суцільних масивах array:
+    offsets (початок сусідів вершини), targets (сусіди) і weights (ваги).
+    Ребра вершини i — це targets[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self, graph):
+        """
+        Будує CSR-подання з графа Graph.
+
+        Параметри:
+            graph (Graph): Граф, побудований через add_edge.
+        """
+        # Нумеруємо вершини у відсортованому порядку, щоб порядок у купі
+        # (відстань, номер) збігався з (відстань, вершина) у Graph.dijkstra
+        try:
+            self.vertices = sorted(graph.graph)
+        except TypeError:
+            self.vertices = list(graph.graph)
+        self.index = {vertex: i for i, vertex in enumerate(self.vertices)}
+        # Порядок вершин, у якому Graph.dijkstra повертає словники
+        self.order = array("q", (self.index[vertex] for vertex in graph.graph))
+
+        is_integer = all(
+            isinstance(weight, int) for edges in graph.graph.values() for _, weight in edges
+        )
+        self.offsets = array("q", [0])
+        self.targets = array("q")
+        self.weights = array("q" if is_integer else "d")
+        for vertex in self.vertices:
+            edges = graph.graph[vertex]
+            self.targets.extend(self.index[neighbor] for neighbor, _ in edges)
+            self.weights.extend(weight for _, weight in edges)
+            self.offsets.append(len(self.targets))
+
+    def dijkstra(self, start):
+        """
+        Реалізує алгоритм Дейкстри над масивами CSR.
+
+        Параметри:
+            start: Початкова вершина.
+
+        Повертає:
+            distances: Словник із найкоротшими відстанями до кожної вершини.
+            predecessors: Словник із попередниками для відновлення шляхів.
+        """
+        vertices = self.vertices
+        if start not in self.index:
+            distances = {vertices[i]: math.inf for i in self.order}
+            predecessors = {vertices[i]: None for i in self.order}
+            distances[start] = 0
+            predecessors[start] = None
+            return distances, predecessors
+
+        dist, pred = _csr_dijkstra(self.offsets, self.targets, self.weights, [self.index[start]])
+
+        # Повертаємо результати з початковими ключами вершин
+        distances = {vertices[i]: dist[i] for i in self.order}
+        predecessors = {vertices[i]: (vertices[pred[i]] if pred[i] >= 0 else None) for i in self.order}
+        return distances, predecessors
+
+    def multi_source_dijkstra(self, sources):
+        """
+        Знаходить для кожної вершини відстань до найближчого з джерел
+        одним запуском Дейкстри, у якому всі джерела стартують з нульовою відстанню.
+
+        Параметри:
+            sources (iterable): Вершини-джерела.
+
+        Повертає:
+            distances: Словник із відстанями до найближчого джерела.
+            nearest: Словник із найближчим джерелом (None для недосяжних вершин).
+        """
+        vertices = self.vertices
+        source_ids = [self.index[source] for source in sources]
+        dist, pred = _csr_dijkstra(self.offsets, self.targets, self.weights, source_ids)
+
+        # Найближче джерело — корінь дерева попередників. Порядок за dist
+        # не годиться (ребра нульової ваги дають рівні відстані), тож
+        # піднімаємося ланцюжком pred до вершини з відомим джерелом
+        # і записуємо його всьому пройденому шляху — разом O(V)
+        origin = [-1] * len(vertices)
+        for source in source_ids:
+            origin[source] = source
+        for v in range(len(vertices)):
+            if origin[v] >= 0 or dist[v] == math.inf:
+                continue
+            path = []
+            while origin[v] < 0:
+                path.append(v)
+                v = pred[v]
+            for u in path:
+                origin[u] = origin[v]
+
+        distances = {vertices[i]: dist[i] for i in self.order}
+        nearest = {vertices[i]: (vertices[origin[i]] if origin[i] >= 0 else None) for i in self.order}
+        return distances, nearest
+
+    def distance_matrix(self, sources=None, workers=None, out=None):
+        """
+        Обчислює відстані від багатьох джерел паралельно в пулі процесів.
+
+        Масиви CSR один раз копіюються у спільну пам'ять, і процеси читають
+        їх напряму, без серіалізації суміжності для кожного завдання. Рядки
+        результату процеси записують одразу в спільну матрицю NumPy або
+        у файл .npy, відображений у пам'ять.
+
+        Параметри:
+            sources (list): Вершини-джерела (за замовчуванням — усі вершини).
+            workers (int): Кількість процесів (за замовчуванням — кількість ядер).
+            out (str): Шлях до файлу .npy; якщо задано, повертається np.memmap.
+
+        Повертає:
+            np.ndarray: Матриця len(sources) x len(vertices); стовпець j
+                відповідає вершині self.vertices[j], недосяжні — math.inf.
+        """
+        if sources is None:
+            sources = [self.vertices[i] for i in self.order]
+        source_ids = [self.index[source] for source in sources]
+        shape = (len(source_ids), len(self.vertices))
+
+        blocks = []
+        matrix = None
+        try:
+            # Спільна пам'ять для масивів CSR
+            buffers = []
+            for values in (self.offsets, self.targets, self.weights):
+                # Принаймні один елемент: порожній масив (граф без ребер) інакше дав би
+                # 1-байтовий блок, який не можна привести до типу масиву в _attach_csr
+                block = shared_memory.SharedMemory(create=True, size=max(1, len(values)) * values.itemsize)
+                block.buf[:len(values) * values.itemsize] = memoryview(values).cast("B")
+                blocks.append(block)
+                buffers.append((block.name, values.typecode, len(values)))
+
+            # Приймач результатів: файл .npy або блок спільної пам'яті
+            if out is not None:
+                matrix = np.lib.format.open_memmap(out, mode="w+", dtype=np.float64, shape=shape)
+                matrix.flush()
+                output = ("file", out)
+            else:
+                block = shared_memory.SharedMemory(create=True, size=max(1, 8 * shape[0] * shape[1]))
+                blocks.append(block)
+                matrix = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+                output = ("shm", block.name)
+
+            workers = workers or os.cpu_count() or 1
+            chunk = max(1, math.ceil(len(source_ids) / (4 * workers)))
+            tasks = [
+                (row, source_ids[row:row + chunk]) for row in range(0, len(source_ids), chunk)
+            ]
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_csr,
+                                     initargs=(buffers, output, shape)) as executor:
+                for _ in executor.map(_distance_rows, tasks):
+                    pass
+
+            if out is not None:
+                return np.lib.format.open_memmap(out, mode="r+")
+            return matrix.copy()
+        finally:
+            # Подання NumPy тримає буфер блоку — без цього close() дав би BufferError
+            del matrix
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    get_path = Graph.get_path
+
+def _csr_dijkstra(offsets, targets, weights, sources):
+    """
+    Ядро алгоритму Дейкстри над масивами CSR із цілими номерами вершин.
+
+    Параметри:
+        offsets, targets, weights: Масиви CSR (array, memoryview тощо).
+        sources (list): Номери вершин-джерел із нульовою відстанню.
+
+    Повертає:
+        tuple: Списки dist і pred (-1 — немає попередника).
+    """
+    n = len(offsets) - 1
+    dist = [math.inf] * n
+    pred = [-1] * n
+    visited = bytearray(n)
+    for source in sources:
+        dist[source] = 0
+
+    pq = [(0, source) for source in sorted(set(sources))]
+    while pq:
+        current_distance, u = heapq.heappop(pq)
+        if visited[u]:
+            continue
+        visited[u] = 1
+
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            if visited[v]:
+                continue
+            distance = current_distance + weights[i]
+            if distance < dist[v]:
+                dist[v] = distance
+                pred[v] = u
+                heapq.heappush(pq, (distance, v))
+    return dist, pred
+
+# Стан процесу-обчислювача distance_matrix: масиви CSR і матриця результатів
+_worker_state = {}
+
+def _attach_csr(buffers, output, shape):
+    """Підключає процес до спільних масивів CSR і матриці результатів."""
+    blocks = []
+    arrays = []
+    for name, typecode, length in buffers:
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays.append(block.buf.cast(typecode)[:length])
+    kind, location = output
+    if kind == "file":
+        matrix = np.lib.format.open_memmap(location, mode="r+")
+    else:
+        block = shared_memory.SharedMemory(name=location)
+        blocks.append(block)
+        matrix = np.ndarray(shape, dtype=np.float64, buffer=block.buf)
+    _worker_state.update(blocks=blocks, arrays=arrays, matrix=matrix)
+
+def _distance_rows(task):
+    """Обчислює рядки матриці відстаней для групи джерел і записує їх на місці."""
+    first_row, source_ids = task
+    offsets, targets, weights = _worker_state["arrays"]
+    matrix = _worker_state["matrix"]
+    for row, source in enumerate(source_ids, start=first_row):
+        dist, _ = _csr_dijkstra(offsets, targets, weights, [source])
+        matrix[row] = dist
+    if isinstance(matrix, np.memmap):
+        matrix.flush()
+
+class Landmarks:
+    """
+    Попередня обробка ALT (A*, Landmarks, Triangle inequality): відстані від
+    кількох опорних вершин до всіх інших і від усіх інших до них. За нерівністю
+    трикутника d(L, t) - d(L, v) ≤ d(v, t) і d(v, L) - d(t, L) ≤ d(v, t), тож
+    максимум по опорних вершинах — допустима й узгоджена евристика для astar.
+    """
+
+    def __init__(self, tables, reverse_tables=None):
+        """
+        Параметри:
+            tables (dict): Опорна вершина -> словник відстаней від неї (результат dijkstra).
+            reverse_tables (dict): Опорна вершина -> словник відстаней до неї;
+                для неорієнтованого графа збігається з tables.
+        """
+        self.tables = tables
+        self.reverse_tables = tables if reverse_tables is None else reverse_tables
+
+    @classmethod
+    def build(cls, graph, landmarks=None, count=8):
+        """
+        Обчислює таблиці відстаней, запускаючи dijkstra від кожної опорної вершини.
+
+        Якщо опорні вершини не задано, вони обираються жадібно «найвіддаленішими»:
+        кожна наступна — найдальша досяжна вершина від уже обраних.
+
+        Параметри:
+            graph (Graph): Граф.
+            landmarks (list): Опорні вершини (необов'язково).
+            count (int): Кількість опорних вершин для автоматичного вибору.
+
+        Повертає:
+            Landmarks: Об'єкт із таблицями відстаней.
+        """
+        tables = {}
+        reverse_tables = {} if graph.directed else tables
+        reverse_graph = graph.reversed_view()
+
+        def add_landmark(landmark):
+            tables[landmark] = graph.dijkstra(landmark)[0]
+            if graph.directed:
+                reverse_tables[landmark] = reverse_graph.dijkstra(landmark)[0]
+
+        if landmarks is not None:
+            for landmark in landmarks:
+                add_landmark(landmark)
+            return cls(tables, reverse_tables)
+
+        if not graph.graph:
+            return cls(tables, reverse_tables)
+        # Перша опорна вершина — найдальша від довільної вершини
+        distances, _ = graph.dijkstra(next(iter(graph.graph)))
+        closest = dict.fromkeys(distances, math.inf)
+        for _ in range(min(count, len(graph.graph))):
+            landmark = max(
+                (vertex for vertex in distances if vertex not in tables and distances[vertex] < math.inf),
+                key=lambda vertex: closest[vertex] if tables else distances[vertex],
+                default=None,
+            )
+            if landmark is None:
+                break
+            add_landmark(landmark)
+            for vertex, distance in tables[landmark].items():
+                closest[vertex] = min(closest[vertex], distance)
+        return cls(tables, reverse_tables)
+
+    def heuristic(self, vertex, target):
+        """
+        Нижня оцінка відстані від vertex до target за нерівністю трикутника.
+
+        Повертає:
+            float: Оцінка; math.inf, якщо target гарантовано недосяжна з vertex.
+        """
+        bound = 0
+        for landmark, from_landmark in self.tables.items():
+            to_landmark = self.reverse_tables[landmark]
+            # inf - inf дає nan, а порівняння з nan хибне — така опорна вершина пропускається
+            for difference in (
+                from_landmark.get(target, math.inf) - from_landmark.get(vertex, math.inf),
+                to_landmark.get(vertex, math.inf) - to_landmark.get(target, math.inf),
+            ):
+                if difference > bound:
+                    bound = difference
+        return bound
+
+    def save(self, filename):
+        """Зберігає таблиці відстаней у файл."""
+        with open(filename, "wb") as file:
+            pickle.dump((self.tables, self.reverse_tables), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, filename):
+        """Завантажує таблиці відстаней, збережені методом save (лише з довірених файлів)."""
+        with open(filename, "rb") as file:
+            return cls(*pickle.load(file))
+
+def euclidean_heuristic(coordinates):
+    """
+    Створює евристику для геометричних графів: пряма відстань між вершинами.
+    Допустима, якщо вага кожного ребра не менша за довжину відрізка між його кінцями.
+
+    Параметри:
+        coordinates (dict): Вершина -> (x, y).
+
+    Повертає:
+        callable: Функція h(vertex, target).
+    """
+    def heuristic(vertex, target):
+        return math.dist(coordinates[vertex], coordinates[target])
+    return heuristic
+
+def make_grid_graph(rows, cols, seed=0):
+    """
+    Генерує геометричний граф-решітку для бенчмарків: вага ребра — довжина
+    відрізка, помножена на випадковий коефіцієнт ≥ 1.
+
+    Повертає:
+        tuple: (Graph, словник координат вершин).
+    """
+    rng = random.Random(seed)
+    g = Graph()
+    coordinates = {}
+    for r in range(rows):
+        for c in range(cols):
+            coordinates[(r, c)] = (c, r)
+            if c + 1 < cols:
+                g.add_edge((r, c), (r, c + 1), round(rng.uniform(1, 3), 2))
+            if r + 1 < rows:
+                g.add_edge((r, c), (r + 1, c), round(rng.uniform(1, 3), 2))
+    return g, coordinates
+
+def make_random_graph(vertex_count, edge_count, max_weight=10, seed=0):
+    """
+    Генерує випадковий зв'язний граф із цілими вагами 1..max_weight.
+
+    Повертає:
+        Graph: Граф з остовним ланцюжком і edge_count - (vertex_count - 1) випадковими ребрами.
+    """
+    rng = random.Random(seed)
+    g = Graph()
+    for v in range(1, vertex_count):
+        g.add_edge(v - 1, v, rng.randint(1, max_weight))
+    for _ in range(max(0, edge_count - (vertex_count - 1))):
+        g.add_edge(rng.randrange(vertex_count), rng.randrange(vertex_count), rng.randint(1, max_weight))
+    return g
+
+def benchmark_queues(graphs, start=0, repeats=3):
+    """
+    Порівнює черги з пріоритетами для dijkstra за піковим розміром черги та часом.
+
+    Параметри:
+        graphs (dict): Назва -> Graph (ваги мають бути цілими для черги Діала).
+        start: Початкова вершина.
+        repeats (int): Кількість запусків; береться найкращий час.
+
+    Повертає:
+        dict: (назва графа, назва черги) -> {"peak_size": ..., "seconds": ...}.
+    """
+    results = {}
+    for graph_name, graph in graphs.items():
+        max_weight = max(w for edges in graph.graph.values() for _, w in edges)
+        for queue_name, factory in QUEUES.items():
+            best = math.inf
+            for _ in range(repeats):
+                queue = factory(max_weight) if factory is DialQueue else factory()
+                start_time = time.perf_counter()
+                graph.dijkstra(start, queue=queue)
+                best = min(best, time.perf_counter() - start_time)
+            results[(graph_name, queue_name)] = {"peak_size": queue.peak_size, "seconds": best}
+    return results
+
+def benchmark_routing(graph, queries, landmarks=None, coordinates=None):
+    """
+    Порівнює повний dijkstra, A* без евристики, ALT і геометричний A*
+    за кількістю оброблених вершин і затримкою на запит.
+
+    Параметри:
+        graph (Graph): Граф.
+        queries (list): Пари (start, target).
+        landmarks (Landmarks): Попередньо обчислені таблиці (необов'язково).
+        coordinates (dict): Координати вершин (необов'язково).
+
+    Повертає:
+        dict: Назва методу -> {"settled": середня кількість, "latency_ms": середня затримка}.
+    """
+    def full_dijkstra(start, target, stats):
+        distances, predecessors = graph.dijkstra(start)
+        stats["settled"] = sum(1 for distance in distances.values() if distance < math.inf)
+        return distances[target], graph.get_path(predecessors, target)
+
+    methods = {
+        "dijkstra": full_dijkstra,
+        "A* (h = 0)": lambda s, t, stats: graph.astar(s, t, stats=stats),
+    }
+    if landmarks is not None:
+        methods["ALT"] = lambda s, t, stats: graph.astar(s, t, landmarks.heuristic, stats)
+    if coordinates is not None:
+        geometric = euclidean_heuristic(coordinates)
+        methods["A* (евклід)"] = lambda s, t, stats: graph.astar(s, t, geometric, stats)
+
+    results = {}
+    for name, method in methods.items():
+        settled = 0
+        start_time = time.perf_counter()
+        for start, target in queries:
+            stats = {}
+            method(start, target, stats)
+            settled += stats["settled"]
+        elapsed = time.perf_counter() - start_time
+        results[name] = {"settled": settled / len(queries), "latency_ms": 1000 * elapsed / len(queries)}
+    return results
+
+# Запис бінарного списку ребер: u, v (int64) і вага (float64), little-endian
+EDGE_DTYPE = np.dtype([("u", "<i8"), ("v", "<i8"), ("weight", "<f8")])
+
+def _text_chunks(data, chunk_size, header):
+    """Ділить відображений у пам'ять текст на шматки, що закінчуються на межі рядка."""
+    size = len(data)
+    position = data.find(b"\n") + 1 if header else 0
+    if header and position == 0:
+        return
+    while position < size:
+        end = min(position + chunk_size, size)
+        if end < size:
+            newline = data.rfind(b"\n", position, end)
+            if newline < 0:
+                newline = data.find(b"\n", end)
+            end = size if newline < 0 else newline + 1
+        yield data[position:end]
+        position = end
+
+# Байти-роздільники полів для bytes.split() (кома замінюється пробілом заздалегідь)
+_SEPARATORS = np.frombuffer(b" \t\n\r\x0b\x0c", dtype=np.uint8)
+
+def _check_fields(chunk, first_line):
+    """
+    Перевіряє векторно, що кожен непорожній рядок шматка містить рівно три поля:
+    рахує початки токенів (не роздільник після роздільника) для кожного рядка.
+
+    Параметри:
+        chunk (bytes): Шматок тексту без коментарів, кома вже замінена пробілом.
+        first_line (int): Кількість рядків файлу перед шматком (для повідомлення).
+    """
+    codes = np.frombuffer(chunk, dtype=np.uint8)
+    if not codes.size:
+        return
+    separator = np.isin(codes, _SEPARATORS)
+    starts = ~separator
+    starts[1:] &= separator[:-1]
+    line = np.cumsum(codes == ord("\n"))
+    counts = np.bincount(line[starts], minlength=int(line[-1]) + 1)
+    bad = np.flatnonzero((counts != 0) & (counts != 3))
+    if bad.size:
+        raise ValueError(f"Рядок {first_line + int(bad[0]) + 1}: очікується три поля u, v, weight, "
+                         f"отримано {int(counts[bad[0]])}")
+
+def load_edge_list(filename, directed=False, dedup="min", fmt="text", vertex_type=int,
+                   weight_type=float, header=False, chunk_size=1 << 22, graph=None):
+    """
+    Потоково завантажує великий список ребер у граф з обмеженою пам'яттю.
+
+    Файл відображається в пам'ять (mmap) і розбирається шматками по chunk_size
+    байтів: текст ділиться на токени одним викликом split на шматок, а бінарні
+    записи читаються NumPy без копіювання; ребра кожного шматка додаються
+    пакетом через Graph.add_edges.
+
+    Параметри:
+        filename (str): Шлях до файлу.
+        directed (bool): Орієнтований граф (якщо graph не передано).
+        dedup (str): Політика паралельних ребер (якщо graph не передано).
+        fmt (str): "text" — рядки "u v weight" з роздільником кома, табуляція
+            або пробіл (текст від # до кінця рядка — коментар); "binary" — записи EDGE_DTYPE.
+        vertex_type (callable): Перетворення токена вершини (bytes), наприклад int або bytes.decode.
+        weight_type (callable): Перетворення токена ваги (bytes).
+        header (bool): Пропустити перший рядок текстового файлу.
+        chunk_size (int): Розмір шматка в байтах.
+        graph (Graph): Наявний граф, до якого додаються ребра.
+
+    Повертає:
+        Graph: Граф із завантаженими ребрами.
+    """
+    if graph is None:
+        graph = Graph(directed=directed, dedup=dedup)
+    with open(filename, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return graph
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if fmt == "binary":
+                total = len(data) // EDGE_DTYPE.itemsize
+                step = max(1, chunk_size // EDGE_DTYPE.itemsize)
+                for first in range(0, total, step):
+                    records = np.frombuffer(data, dtype=EDGE_DTYPE, count=min(step, total - first),
+                                            offset=first * EDGE_DTYPE.itemsize)
+                    graph.add_edges(zip(records["u"].tolist(), records["v"].tolist(),
+                                        records["weight"].tolist()))
+                    del records  # Звільняємо буфер, інакше mmap не закриється
+            elif fmt == "text":
+                line_number = 1 if header else 0
+                for chunk in _text_chunks(data, chunk_size, header):
+                    lines_in_chunk = chunk.count(b"\n")
+                    if b"#" in chunk:
+                        # Коментар — від # до кінця рядка; рядки зберігаються для нумерації
+                        chunk = b"\n".join(line.split(b"#", 1)[0] for line in chunk.split(b"\n"))
+                    chunk = chunk.replace(b",", b" ")
+                    _check_fields(chunk, line_number)
+                    line_number += lines_in_chunk
+                    tokens = chunk.split()
+                    graph.add_edges(zip(map(vertex_type, tokens[0::3]), map(vertex_type, tokens[1::3]),
+                                        map(weight_type, tokens[2::3])))
+            else:
+                raise ValueError(f"Невідомий формат: {fmt}")
+    return graph
+
+def save_edge_list_binary(filename, edges, chunk_edges=1 << 18):
+    """
+    Записує ребра у бінарному форматі EDGE_DTYPE шматками.
+
+    Параметри:
+        filename (str): Шлях до файлу.
+        edges (iterable): Трійки (u, v, weight) з цілими вершинами.
+        chunk_edges (int): Кількість ребер в одному шматку запису.
+    """
+    edges = iter(edges)
+    with open(filename, "wb") as file:
+        while True:
+            chunk = np.fromiter(itertools.islice(edges, chunk_edges), dtype=EDGE_DTYPE)
+            if not len(chunk):
+                break
+            chunk.tofile(file)
+
+def benchmark_loader(edge_count=300_000, vertex_count=50_000, seed=0):
+    """
+    Вимірює пропускну здатність завантаження списку ребер (ребер за секунду):
+    add_edge для кожного рядка проти потокових текстового та бінарного завантажувачів.
+
+    Повертає:
+        dict: Назва способу -> ребер за секунду.
+    """
+    rng = random.Random(seed)
+    edges = [(rng.randrange(vertex_count), rng.randrange(vertex_count), rng.randint(1, 100))
+             for _ in range(edge_count)]
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        text_file = os.path.join(directory, "edges.csv")
+        binary_file = os.path.join(directory, "edges.bin")
+        with open(text_file, "w") as file:
+            file.writelines(f"{u},{v},{w}\n" for u, v, w in edges)
+        save_edge_list_binary(binary_file, edges)
+
+        def line_by_line():
+            g = Graph(dedup="min")
+            with open(text_file) as file:
+                for line in file:
+                    u, v, w = line.split(",")
+                    g.add_edge(int(u), int(v), float(w))
+
+        for name, load in (
+            ("add_edge по рядку", line_by_line),
+            ("текстовий завантажувач", lambda: load_edge_list(text_file)),
+            ("бінарний завантажувач", lambda: load_edge_list(binary_file, fmt="binary")),
+        ):
+            start_time = time.perf_counter()
+            load()
+            results[name] = edge_count / (time.perf_counter() - start_time)
+    return results
+
 def main():
     """Приклад використання алгоритму Дейкстри."""
     # Створюємо граф
@@ -83,6 +1375,7 @@ def main():
     
     for u, v, weight in edges:
         g.add_edge(u, v, weight)
+
     
     # Запускаємо алгоритм Дейкстри від вершини 'A'
     start_vertex = 'A'
@@ -97,5 +1390,62 @@ def main():
             path = g.get_path(predecessors, vertex)
             print(f"До {vertex}: {distance}, шлях: {' -> '.join(path)}")
 
+    # Інкрементне оновлення дерева найкоротших шляхів
+    tree = g.shortest_path_tree(start_vertex)
+    g.update_edge('D', 'E', 1)
+    print(f"Після зміни ваги D-E дерево застаріле: {tree.is_stale}, "
+          f"до E: {tree.distances['E']}, шлях: {' -> '.join(tree.get_path('E'))}")
+    g.update_edge('D', 'E', 2)
+
+    # Запит між двома вершинами з раннім виходом
+    for bidirectional in (False, True):
+        distance, path = g.shortest_path('A', 'E', bidirectional=bidirectional)
+        mode = "двонаправлений" if bidirectional else "однонаправлений"
+        print(f"A -> E ({mode}): {distance}, шлях: {' -> '.join(path)}")
+
+    # Компактне CSR-подання дає ті самі результати
+    csr_graph = g.freeze()
+    print(f"CSR: {len(csr_graph.vertices)} вершин, {len(csr_graph.targets)} записів суміжності, "
+          f"результати збігаються: {csr_graph.dijkstra(start_vertex) == (distances, predecessors)}")
+
+    # Маршрутизація A* та ALT на геометричній решітці
+    grid, coordinates = make_grid_graph(60, 60)
+    landmarks = Landmarks.build(grid, count=8)
+    rng = random.Random(1)
+    vertices = list(grid.graph)
+    queries = [(rng.choice(vertices), rng.choice(vertices)) for _ in range(20)]
+    print("\nПорівняння маршрутизації (решітка 60x60):")
+    for name, result in benchmark_routing(grid, queries, landmarks, coordinates).items():
+        print(f"{name}: {result['settled']:.0f} оброблених вершин, {result['latency_ms']:.2f} мс на запит")
+
+    # Відстані від багатьох джерел паралельно та найближче джерело
+    grid_csr = grid.freeze()
+    matrix = grid_csr.distance_matrix(vertices[:200])
+    print(f"\nМатриця відстаней: {matrix.shape}, максимум {matrix.max():.2f}")
+    depots = [(0, 0), (59, 59), (0, 59)]
+    _, nearest = grid_csr.multi_source_dijkstra(depots)
+    print(f"Найближчий склад до (30, 30): {nearest[(30, 30)]}")
+
+    # Порівняння черг з пріоритетами на розрідженому та щільному графах
+    graphs = {
+        "розріджений": make_random_graph(20000, 60000),
+        "щільний": make_random_graph(500, 60000),
+    }
+    print("\nПорівняння черг з пріоритетами:")
+    for (graph_name, queue_name), result in benchmark_queues(graphs).items():
+        print(f"{graph_name}, {queue_name}: пік черги {result['peak_size']}, {1000 * result['seconds']:.1f} мс")
+
+    # Орієнтований граф із дедуплікацією паралельних ребер
+    directed = Graph(directed=True, dedup="min")
+    for u, v, weight in [('A', 'B', 4), ('A', 'B', 1), ('B', 'C', 2), ('C', 'A', 1)]:
+        directed.add_edge(u, v, weight)
+    print(f"\nОрієнтований граф: A -> C = {directed.shortest_path('A', 'C')}, "
+          f"C -> B = {directed.shortest_path('C', 'B', bidirectional=True)}")
+
+    # Пропускна здатність завантаження списку ребер
+    print("\nЗавантаження списку ребер:")
+    for name, rate in benchmark_loader().items():
+        print(f"{name}: {rate:,.0f} ребер/с")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
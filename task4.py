@@ -2,8 +2,20 @@
 
 import uuid
 import heapq
+import itertools
+import math
+import operator
+import os
+import random
+import time
+from array import array
+from functools import cmp_to_key
+from concurrent.futures import ProcessPoolExecutor
 import networkx as nx
 import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image, ImageDraw
+from matplotlib.collections import LineCollection
 
 class Node:
     def __init__(self, key, color="skyblue"):
@@ -13,14 +25,17 @@ class Node:
         self.val = key
         self.color = color
         self.id = str(uuid.uuid4())
+        self.children = None  # Нащадки d-арної купи (для бінарної — left/right)
+        self.arity = 2  # Арність купи, з якої побудовано вузол
 
-def heap_to_tree(heap, index=0):
+def heap_to_tree(heap, index=0, arity=2):
     """
     Перетворює масив бінарної купи в бінарне дерево.
     
     Параметри:
-        heap (list): Масив, що представляє бінарну купу.
+        heap (list): Масив, що представляє бінарну купу (або DaryHeap).
         index (int): Поточний індекс у масиві.
+        arity (int): Кількість нащадків вузла (для DaryHeap — heap.arity).
     
     Повертає:
         Node: Корінь піддерева або None.
@@ -29,6 +44,15 @@ def heap_to_tree(heap, index=0):
         return None
     
     node = Node(heap[index])
+    node.arity = arity
+
+    if arity != 2:
+        # Нащадки вузла d-арної купи: d*index + 1 ... d*index + d
+        node.children = [
+            child for child in (heap_to_tree(heap, arity * index + k, arity) for k in range(1, arity + 1))
+            if child is not None
+        ]
+        return node
     
     # Лівий нащадок: 2*index + 1
     node.left = heap_to_tree(heap, 2 * index + 1)
@@ -51,7 +75,18 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
     Повертає:
         nx.DiGraph: Оновлений граф.
     """
-    if node is not None:
+    if node is not None and node.children is not None:
+        graph.add_node(node.id, color=node.color, label=node.val)
+        # Нащадок k стоїть на k-й з arity позицій проміжку батька — і тоді,
+        # коли останній батько заповнений лише частково
+        arity = node.arity
+        span = 2 / arity ** layer
+        for k, child in enumerate(node.children):
+            graph.add_edge(node.id, child.id)
+            child_x = x + (k - (arity - 1) / 2) * span
+            pos[child.id] = (child_x, y - 1)
+            add_edges(graph, child, pos, x=child_x, y=y - 1, layer=layer + 1)
+    elif node is not None:
         graph.add_node(node.id, color=node.color, label=node.val)
         if node.left:
             graph.add_edge(node.id, node.left.id)
@@ -65,12 +100,14 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
             add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
     return graph
 
-def draw_heap(tree_root):
+def draw_heap(tree_root, filename="heap_visualization.png", title="Візуалізація бінарної купи"):
     """
     Візуалізує бінарну купу як дерево та зберігає у файл PNG.
     
     Параметри:
         tree_root (Node): Корінь дерева купи.
+        filename (str): Ім'я вихідного файлу.
+        title (str): Заголовок малюнка.
     """
     tree = nx.DiGraph()
     pos = {tree_root.id: (0, 0)}
@@ -81,10 +118,534 @@ def draw_heap(tree_root):
 
     plt.figure(figsize=(8, 5))
     nx.draw(tree, pos=pos, labels=labels, arrows=False, node_size=2500, node_color=colors)
-    plt.title("Візуалізація бінарної купи")
-    plt.savefig("heap_visualization.png", format="png", bbox_inches="tight")
+    plt.title(title)
+    plt.savefig(filename, format="png", bbox_inches="tight")
     plt.close()  # Закриваємо фігуру, щоб уникнути відображення в Codespaces
 
+def level_starts(count, arity=2):
+    """Повертає індекси перших вузлів кожного рівня купи (і кінця масиву)."""
+    starts = [0]
+    width = 1
+    while starts[-1] < count:
+        starts.append(starts[-1] + width)
+        width *= arity
+    return starts
+
+def heap_positions(count, arity=2):
+    """
+    Обчислює координати вузлів купи арифметично за їхніми індексами —
+    так само, як add_edges: вузол зі зсувом p на рівні d (ширина рівня
+    w = arity^d) має x = -1 + (2p + 1) / w, y = -d.
+
+    Параметри:
+        count (int): Кількість вузлів.
+        arity (int): Кількість нащадків вузла.
+
+    Повертає:
+        tuple: Масиви NumPy x, y та глибин вузлів.
+    """
+    index = np.arange(count, dtype=np.int64)
+    starts = np.array(level_starts(count, arity), dtype=np.int64)
+    depth = np.searchsorted(starts, index, side="right") - 1
+    offset = index - starts[depth]
+    x = -1 + (2 * offset + 1) / np.power(float(arity), depth)
+    return x, -depth.astype(float), depth
+
+def draw_heap_array(heap, filename="heap_visualization.png", title="Візуалізація бінарної купи",
+                    colors="skyblue", max_nodes=4095, max_labels=63, arity=2):
+    """
+    Візуалізує купу напряму з масиву, без дерева вузлів і networkx.
+
+    Позиції обчислюються за індексами, ребра малюються одним LineCollection,
+    вузли — одним scatter. Якщо вузлів більше за max_nodes, малюються лише
+    верхні рівні, а нижчі зводяться до підсумку (кількість, мінімум і
+    максимум значень кожного прихованого рівня).
+
+    Параметри:
+        heap (list): Масив, що представляє бінарну купу.
+        filename (str): Ім'я вихідного файлу.
+        title (str): Заголовок малюнка.
+        colors: Колір усіх вузлів або послідовність кольорів за індексами.
+        max_nodes (int): Найбільша кількість вузлів, що малюються окремо.
+        max_labels (int): Найбільша кількість вузлів, що підписуються значеннями.
+        arity (int): Кількість нащадків вузла (для DaryHeap — heap.arity).
+    """
+    count = len(heap)
+    # Кількість повних рівнів, що вміщаються в max_nodes
+    starts = level_starts(max(count, max_nodes + 1), arity)
+    shown_levels = max(1, sum(1 for start in starts[1:] if start <= max_nodes))
+    shown = min(count, starts[shown_levels])
+    x, y, depth = heap_positions(shown, arity)
+
+    plt.figure(figsize=(8, 5))
+    axes = plt.gca()
+    if shown > 1:
+        child = np.arange(1, shown)
+        parent = (child - 1) // arity
+        segments = np.stack([np.column_stack((x[parent], y[parent])),
+                             np.column_stack((x[child], y[child]))], axis=1)
+        axes.add_collection(LineCollection(segments, colors="gray", linewidths=0.5 if shown > max_labels else 1))
+
+    # Розмір вузла зменшується з шириною найнижчого намальованого рівня
+    widest = arity ** int(depth[-1]) if shown else 1
+    node_size = max(2, min(2500, 10000 / widest))
+    node_colors = colors if isinstance(colors, str) else list(colors)[:shown]
+    axes.scatter(x, y, s=node_size, c=node_colors, zorder=2)
+    if shown <= max_labels:
+        for i in range(shown):
+            axes.text(x[i], y[i], str(heap[i]), ha="center", va="center", zorder=3)
+
+    if shown < count:
+        # Зведений вигляд прихованих рівнів
+        lines = []
+        level, start = shown_levels, shown
+        while start < count:
+            end = min(count, arity * start + 1)
+            values = heap[start:end]
+            lines.append(f"рівень {level}: {end - start} вузлів, min {min(values)}, max {max(values)}")
+            level, start = level + 1, end
+        summary = lines if len(lines) <= 6 else lines[:3] + ["..."] + lines[-2:]
+        axes.text(0, -shown_levels, "\n".join(summary), ha="center", va="top", fontsize=8)
+        title = f"{title} (показано {shown} з {count} вузлів)"
+
+    axes.margins(0.08, 0.15)  # Запас, щоб великі вузли не обрізались
+    axes.autoscale_view()
+    axes.set_axis_off()
+    plt.title(title)
+    plt.savefig(filename, format="png", bbox_inches="tight")
+    plt.close()
+
+class HeapRecorder:
+    """
+    Інструментована мін-купа: виконує heappush/heappop/heapify над власним
+    масивом і записує кожну елементарну зміну як подію:
+      ("append", i, value) — новий вузол у кінці масиву;
+      ("set", i, value) — заміна значення вузла;
+      ("remove", i) — видалення останнього вузла;
+      ("swap", i, j) — обмін вузлів під час просіювання.
+    """
+
+    def __init__(self, items=()):
+        self.heap = list(items)
+        self.initial = list(self.heap)
+        self.events = []
+
+    def heappush(self, item):
+        """Додає елемент і просіює його вгору."""
+        self.heap.append(item)
+        self.events.append(("append", len(self.heap) - 1, item))
+        self._sift_up(len(self.heap) - 1)
+
+    def heappop(self):
+        """Вилучає найменший елемент: останній вузол переходить у корінь і просіюється вниз."""
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.events.append(("remove", len(heap)))
+        if heap:
+            heap[0] = last
+            self.events.append(("set", 0, last))
+            self._sift_down(0)
+        return top
+
+    def heapify(self):
+        """Перетворює масив на купу за O(n), просіюючи внутрішні вузли знизу вгору."""
+        for i in reversed(range(len(self.heap) // 2)):
+            self._sift_down(i)
+
+    def _swap(self, i, j):
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.events.append(("swap", i, j))
+
+    def _sift_up(self, i):
+        heap = self.heap
+        while i > 0:
+            parent = (i - 1) // 2
+            if not heap[i] < heap[parent]:
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i):
+        heap = self.heap
+        size = len(heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < size and heap[child] < heap[smallest]:
+                    smallest = child
+            if smallest == i:
+                return
+            self._swap(i, smallest)
+            i = smallest
+
+def apply_heap_event(heap, event):
+    """Застосовує подію HeapRecorder до масиву; повертає індекси змінених вузлів."""
+    kind = event[0]
+    if kind == "swap":
+        _, i, j = event
+        heap[i], heap[j] = heap[j], heap[i]
+        return (i, j)
+    if kind == "set":
+        heap[event[1]] = event[2]
+    elif kind == "append":
+        heap.append(event[2])
+    elif kind == "remove":
+        heap.pop()
+    return (event[1],)
+
+class _FrameCanvas:
+    """Растрове полотно кадру з фіксованими позиціями вузлів за індексами."""
+
+    def __init__(self, capacity, size, labels):
+        self.size = size
+        self.labels = labels
+        width, height = size
+        x, y, depth = heap_positions(capacity)
+        levels = int(depth[-1]) + 1 if capacity else 1
+        margin = 30
+        self.x = (margin + (x + 1) / 2 * (width - 2 * margin)).tolist()
+        self.y = (margin - y * (height - 2 * margin) / max(1, levels - 1)).tolist()
+        spacing = (width - 2 * margin) / 2 ** (levels - 1)
+        self.radius = max(1.5, min(18, spacing / 2.5))
+
+    def node(self, draw, i, value, color):
+        """Малює вузол (коло та підпис)."""
+        x, y, r = self.x[i], self.y[i], self.radius
+        draw.ellipse((x - r, y - r, x + r, y + r), fill=color, outline="black" if r > 3 else None)
+        if self.labels:
+            draw.text((x, y), str(value), fill="black", anchor="mm")
+
+    def erase(self, draw, i):
+        """Стирає вузол i разом із ребром до батька."""
+        r = self.radius + 1
+        if i > 0:
+            parent = (i - 1) // 2
+            draw.line((self.x[parent], self.y[parent], self.x[i], self.y[i]), fill="white", width=3)
+        draw.ellipse((self.x[i] - r, self.y[i] - r, self.x[i] + r, self.y[i] + r), fill="white")
+
+    def edge(self, draw, i):
+        """Малює ребро від вузла i до батька."""
+        parent = (i - 1) // 2
+        draw.line((self.x[parent], self.y[parent], self.x[i], self.y[i]), fill="gray", width=1)
+
+    def full(self, heap, highlight=()):
+        """Малює весь кадр з нуля — лише для першого кадру сегмента."""
+        image = Image.new("RGB", self.size, "white")
+        draw = ImageDraw.Draw(image)
+        for i in range(1, len(heap)):
+            self.edge(draw, i)
+        for i, value in enumerate(heap):
+            self.node(draw, i, value, "orange" if i in highlight else "skyblue")
+        return image
+
+def _render_frame_segment(job):
+    """
+    Рендерить послідовні кадри одного сегмента подій (виконується в окремому процесі).
+    Перший кадр малюється повністю, кожен наступний — лише змінені вузли.
+    """
+    heap, events, first_frame, capacity, size, labels, directory = job
+    canvas = _FrameCanvas(capacity, size, labels)
+    image = canvas.full(heap)
+    draw = ImageDraw.Draw(image)
+    paths = []
+    if first_frame == 0:
+        paths.append(os.path.join(directory, "frame_00000.png"))
+        image.save(paths[-1])
+
+    highlighted = ()
+    for number, event in enumerate(events, start=first_frame + 1):
+        # Знімаємо підсвічування з попереднього кроку
+        for i in highlighted:
+            if i < len(heap):
+                canvas.node(draw, i, heap[i], "skyblue")
+        if event[0] == "remove":
+            canvas.erase(draw, event[1])
+            heap.pop()
+            if event[1] > 0:
+                parent = (event[1] - 1) // 2
+                canvas.node(draw, parent, heap[parent], "skyblue")
+            highlighted = ()
+        else:
+            changed = apply_heap_event(heap, event)
+            if event[0] == "append" and event[1] > 0:
+                canvas.edge(draw, event[1])
+                parent = (event[1] - 1) // 2
+                canvas.node(draw, parent, heap[parent], "skyblue")
+            for i in changed:
+                canvas.node(draw, i, heap[i], "orange")
+            highlighted = changed
+        paths.append(os.path.join(directory, f"frame_{number:05d}.png"))
+        image.save(paths[-1])
+    return paths
+
+def render_heap_animation(recorder, directory="heap_frames", gif=None, size=(1200, 700),
+                          workers=None, max_labels=63, frame_duration=300):
+    """
+    Перетворює записані події купи на кадри анімації.
+
+    Події діляться на сегменти; стан купи на початку кожного сегмента
+    відтворюється простим застосуванням подій до масиву, тож сегменти
+    рендеряться паралельно в пулі процесів. Усередині сегмента кожен
+    кадр перемальовує лише змінені вузли — O(змін), а не O(n).
+
+    Параметри:
+        recorder (HeapRecorder): Записані операції.
+        directory (str): Каталог для кадрів frame_NNNNN.png.
+        gif (str): Якщо задано, кадри також збираються в GIF-анімацію.
+        size (tuple): Розмір кадру в пікселях.
+        workers (int): Кількість процесів (за замовчуванням — кількість ядер).
+        max_labels (int): Підписувати значення, лише якщо вузлів не більше.
+        frame_duration (int): Тривалість кадру GIF у мілісекундах.
+
+    Повертає:
+        list: Шляхи до кадрів у порядку відтворення.
+    """
+    os.makedirs(directory, exist_ok=True)
+    events = recorder.events
+    # Місткість — найбільший розмір купи за весь запис
+    heap = list(recorder.initial)
+    capacity = len(heap)
+    for event in events:
+        if event[0] == "append":
+            capacity = max(capacity, event[1] + 1)
+    labels = capacity <= max_labels
+
+    workers = workers or os.cpu_count() or 1
+    segment = max(1, math.ceil(len(events) / workers))
+    jobs = []
+    for start in range(0, max(1, len(events)), segment):
+        jobs.append((list(heap), events[start:start + segment], start, capacity, size, labels, directory))
+        for event in events[start:start + segment]:
+            apply_heap_event(heap, event)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        paths = [path for segment_paths in executor.map(_render_frame_segment, jobs) for path in segment_paths]
+
+    if gif:
+        frames = (Image.open(path) for path in paths[1:])
+        Image.open(paths[0]).save(gif, save_all=True, append_images=frames,
+                                  duration=frame_duration, loop=0)
+    return paths
+
+class DaryHeap:
+    """
+    d-арна мін-купа над компактним масивом array.
+
+    Вузол i має нащадків arity*i + 1 ... arity*i + arity, тож при більшій
+    арності дерево нижче, а pop робить менше рівнів просіювання.
+    Порядок задається функцією less(a, b); для max-купи — operator.gt.
+
+    Параметри:
+        items (iterable): Початкові елементи (купа будується за O(n)).
+        arity (int): Кількість нащадків вузла (≥ 2).
+        less (callable): Строгий порядок «a має бути вище за b».
+        typecode (str): Код типу array; None — звичайний список для довільних об'єктів.
+    """
+
+    def __init__(self, items=(), arity=4, less=operator.lt, typecode="q"):
+        if arity < 2:
+            raise ValueError("Арність купи має бути не меншою за 2")
+        self.arity = arity
+        self.less = less
+        self.typecode = typecode
+        self.data = array(typecode, items) if typecode else list(items)
+        self.heapify()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        return self.data[index]
+
+    def __iter__(self):
+        """Елементи в порядку масиву (не відсортовані)."""
+        return iter(self.data)
+
+    def peek(self):
+        """Повертає найменший елемент без вилучення."""
+        return self.data[0]
+
+    def push(self, item):
+        """Додає елемент за O(log_d n)."""
+        self.data.append(item)
+        self._sift_up(len(self.data) - 1)
+
+    def pop(self):
+        """Вилучає та повертає найменший елемент за O(d · log_d n)."""
+        data = self.data
+        last = data.pop()
+        if not data:
+            return last
+        top = data[0]
+        data[0] = last
+        self._sift_down(0)
+        return top
+
+    def pushpop(self, item):
+        """Додає елемент і вилучає найменший — швидше за push, а потім pop."""
+        data = self.data
+        if data and self.less(data[0], item):
+            item, data[0] = data[0], item
+            self._sift_down(0)
+        return item
+
+    def replace(self, item):
+        """Вилучає найменший елемент і додає новий; купа не може бути порожньою."""
+        data = self.data
+        top = data[0]
+        data[0] = item
+        self._sift_down(0)
+        return top
+
+    def heapify(self):
+        """Відновлює властивість купи за O(n), просіюючи внутрішні вузли знизу вгору."""
+        for i in reversed(range((len(self.data) - 2) // self.arity + 1)):
+            self._sift_down(i)
+
+    def merge(self, *others):
+        """
+        Зливає інші купи або ітеровані об'єкти в цю купу за O(n + m)
+        (дописування в масив і одна побудова купи).
+
+        Повертає:
+            DaryHeap: Цю ж купу.
+        """
+        for other in others:
+            self.data.extend(other.data if isinstance(other, DaryHeap) else other)
+        self.heapify()
+        return self
+
+    @classmethod
+    def nsmallest(cls, k, iterable, arity=4, less=operator.lt, typecode=None):
+        """
+        Знаходить k найменших елементів потоку за O(n log k) часу та O(k) пам'яті:
+        тримає обернену купу з k кандидатів, корінь якої — найбільший з них.
+
+        Повертає:
+            list: k найменших елементів у порядку зростання.
+        """
+        if k <= 0:
+            return []
+        iterator = iter(iterable)
+        def greater(a, b):
+            return less(b, a)
+        candidates = cls(itertools.islice(iterator, k), arity, greater, typecode)
+        for item in iterator:
+            if less(item, candidates.data[0]):
+                candidates.replace(item)
+        def compare(a, b):
+            return -1 if less(a, b) else (1 if less(b, a) else 0)
+        return sorted(candidates.data, key=cmp_to_key(compare))
+
+    def _sift_up(self, i):
+        # Метод «дірки»: зсуваємо батьків униз і записуємо елемент один раз
+        data, less, arity = self.data, self.less, self.arity
+        item = data[i]
+        if less is operator.lt:
+            # Звичайний порядок: оператор < без виклику функції на кожне порівняння
+            while i > 0:
+                parent = (i - 1) // arity
+                value = data[parent]
+                if not item < value:
+                    break
+                data[i] = value
+                i = parent
+        else:
+            while i > 0:
+                parent = (i - 1) // arity
+                value = data[parent]
+                if not less(item, value):
+                    break
+                data[i] = value
+                i = parent
+        data[i] = item
+
+    def _sift_down(self, i):
+        # Як у heapq: спершу опускаємо «дірку» до листка за найменшими нащадками
+        # (без порівнянь із самим елементом), потім піднімаємо елемент на місце.
+        # Нащадків перебираємо простим while з прямими індексами: range, зрізи
+        # та min на кожному рівні коштують більше за самі порівняння.
+        data, less, arity = self.data, self.less, self.arity
+        size = len(data)
+        start = i
+        item = data[i]
+        first = arity * i + 1
+        natural = less is operator.lt
+        while first < size:
+            end = first + arity
+            if end > size:
+                end = size
+            best = first
+            best_value = data[first]
+            child = first + 1
+            if natural:
+                while child < end:
+                    value = data[child]
+                    if value < best_value:
+                        best, best_value = child, value
+                    child += 1
+            else:
+                while child < end:
+                    value = data[child]
+                    if less(value, best_value):
+                        best, best_value = child, value
+                    child += 1
+            data[i] = best_value
+            i = best
+            first = arity * i + 1
+        data[i] = item
+        # Підйом лише до початкової позиції
+        if natural:
+            while i > start:
+                parent = (i - 1) // arity
+                value = data[parent]
+                if not item < value:
+                    break
+                data[i] = value
+                i = parent
+        else:
+            while i > start:
+                parent = (i - 1) // arity
+                value = data[parent]
+                if not less(item, value):
+                    break
+                data[i] = value
+                i = parent
+        data[i] = item
+
+def benchmark_heaps(n=200_000, arities=(2, 4, 8), seed=0):
+    """
+    Порівнює DaryHeap різної арності з heapq: побудова, n вставок і n вилучень.
+
+    Повертає:
+        dict: Назва -> {"heapify": с, "push": с, "pop": с}.
+    """
+    rng = random.Random(seed)
+    values = [rng.randrange(1 << 40) for _ in range(n)]
+    results = {}
+
+    def measure(action):
+        start_time = time.perf_counter()
+        action()
+        return time.perf_counter() - start_time
+
+    heap = list(values)
+    stats = {"heapify": measure(lambda: heapq.heapify(heap))}
+    heap = []
+    stats["push"] = measure(lambda: [heapq.heappush(heap, value) for value in values])
+    stats["pop"] = measure(lambda: [heapq.heappop(heap) for _ in range(n)])
+    results["heapq"] = stats
+
+    for arity in arities:
+        stats = {"heapify": measure(lambda: DaryHeap(values, arity))}
+        heap = DaryHeap(arity=arity)
+        stats["push"] = measure(lambda: [heap.push(value) for value in values])
+        stats["pop"] = measure(lambda: [heap.pop() for _ in range(n)])
+        results[f"DaryHeap(arity={arity})"] = stats
+    return results
+
 def main():
     """Створює бінарну купу та візуалізує її."""
     # Приклад масиву для створення min-heap
@@ -100,5 +661,31 @@ def main():
     # Візуалізуємо купу
     draw_heap(root)
 
+    # Велика купа малюється напряму з масиву зі зведеним виглядом нижніх рівнів
+    large_heap = list(range(100_000, 0, -1))
+    heapq.heapify(large_heap)
+    draw_heap_array(large_heap, filename="heap_visualization_large.png")
+
+    # Покрокова анімація heapify, heappush і heappop
+    recorder = HeapRecorder([10, 5, 3, 4, 1, 0, 8])
+    recorder.heapify()
+    recorder.heappush(2)
+    recorder.heappop()
+    paths = render_heap_animation(recorder, gif="heap_operations.gif")
+    print(f"Анімація: {len(paths)} кадрів збережено у heap_operations.gif")
+
+    # d-арна купа над компактним масивом і її візуалізація
+    dary_heap = DaryHeap([10, 5, 3, 4, 1, 0, 8, 7, 2, 6], arity=3)
+    print("3-арна купа:", list(dary_heap))
+    draw_heap(heap_to_tree(dary_heap, arity=dary_heap.arity), filename="dary_heap_tree.png",
+              title="Візуалізація 3-арної купи")
+    draw_heap_array(dary_heap, filename="dary_heap_visualization.png",
+                    title="Візуалізація 3-арної купи", arity=dary_heap.arity)
+    print("3 найменші з потоку:", DaryHeap.nsmallest(3, iter(range(1_000_000, 0, -7))))
+
+    print("\nПорівняння з heapq (200 000 елементів):")
+    for name, stats in benchmark_heaps().items():
+        print(f"{name}: heapify {stats['heapify']:.3f} с, push {stats['push']:.3f} с, pop {stats['pop']:.3f} с")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
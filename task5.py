@@ -1,10 +1,15 @@
 # Візуалізація обходів бінарного дерева (DFS і BFS) з кольорами
 
+import time
 import uuid
-import networkx as nx
+from collections import deque, namedtuple
 import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
 
 class Node:
+    __slots__ = ("left", "right", "val", "color", "id")
+
     def __init__(self, key, color="skyblue"):
         """Ініціалізує вузол дерева."""
         self.left = None
@@ -38,27 +43,415 @@ def add_edges(graph, node, pos, x=0, y=0, layer=1):
             add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
     return graph
 
-def draw_tree(tree_root, title, filename):
+TRAVERSAL_ORDERS = ("bfs", "preorder", "inorder", "postorder")
+TRAVERSAL_TITLES = {
+    "bfs": "Обхід у ширину (BFS)",
+    "preorder": "Обхід у глибину (DFS, pre-order)",
+    "inorder": "Обхід у глибину (DFS, in-order)",
+    "postorder": "Обхід у глибину (DFS, post-order)",
+}
+
+def draw_tree(tree_root, title, filename, max_nodes=4095, max_labels=63, layout=None):
     """
     Візуалізує дерево та зберігає у файл PNG.
     
+    Щоб не перераховувати розкладку для кожного рендера того самого
+    дерева, передайте спільний TreeLayout.
+
     Параметри:
         tree_root (Node): Корінь дерева.
         title (str): Заголовок малюнка.
         filename (str): Ім'я вихідного файлу.
+        max_nodes (int): Найбільша кількість вузлів, що малюються окремо.
+        max_labels (int): Найбільша кількість вузлів, що підписуються значеннями.
+        layout (TreeLayout): Готова розкладка цього дерева.
+    """
+    if layout is None:
+        layout = TreeLayout(tree_root)
+    colors = [node.color for node in layout.nodes]
+    figure, _, _ = _draw_layout(layout, colors, title, max_nodes, max_labels)
+    figure.savefig(filename, format="png", bbox_inches="tight")
+    plt.close(figure)
+
+class TreeLayout:
+    """
+    Розкладка дерева, обчислена один раз: вузли в порядку рівнів,
+    їхні координати (корінь у (0, 0), нащадки рівня d зміщені на ±1/2^d,
+    y = -d) та індекси батьків. Спільна для всіх рендерів обходів одного
+    дерева; після зміни структури дерева розкладку треба побудувати заново.
+
+    Параметри:
+        root (Node): Корінь дерева.
+    """
+
+    def __init__(self, root):
+        self.nodes = traverse(root, "bfs")
+        self.index_of = {node: i for i, node in enumerate(self.nodes)}
+        count = len(self.nodes)
+        self.x = np.zeros(count)
+        self.depth = np.zeros(count, dtype=np.int64)
+        self.parent = np.full(count, -1, dtype=np.int64)
+        x, depth, parent = self.x, self.depth, self.parent
+        # У порядку рівнів батько завжди обробляється раніше за нащадків
+        for i, node in enumerate(self.nodes):
+            shift = 1 / 2 ** (depth[i] + 1)
+            for child, sign in ((node.left, -1), (node.right, 1)):
+                if child is not None:
+                    j = self.index_of[child]
+                    x[j] = x[i] + sign * shift
+                    depth[j] = depth[i] + 1
+                    parent[j] = i
+        self.y = -self.depth.astype(float)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def order_colors(self, order):
+        """
+        Кольори вузлів (у порядку розкладки) за градієнтом обходу order,
+        не змінюючи node.color.
+        """
+        nodes = traverse(self.nodes[0] if self.nodes else None, order)
+        index_of = self.index_of
+        if len(nodes) != len(self.nodes) or any(node not in index_of for node in nodes):
+            raise ValueError("Структура дерева змінилася — побудуйте TreeLayout заново")
+        colors = [None] * len(nodes)
+        for start, end, color in gradient_runs(len(nodes)):
+            for node in nodes[start:end]:
+                colors[index_of[node]] = color
+        return colors
+
+def _draw_layout(layout, colors, title, max_nodes, max_labels):
     """
-    tree = nx.DiGraph()
-    pos = {tree_root.id: (0, 0)}
-    tree = add_edges(tree, tree_root, pos)
+    Малює розкладку однією колекцією ребер і одним scatter для вузлів.
 
-    colors = [node[1]['color'] for node in tree.nodes(data=True)]
-    labels = {node[0]: node[1]['label'] for node in tree.nodes(data=True)}
+    Рівень деталізації: якщо вузлів більше за max_nodes, малюються лише
+    верхні рівні, що вміщаються, а підписи — лише до max_labels вузлів.
+
+    Повертає:
+        tuple: Фігура, колекція вузлів і кількість намальованих вузлів.
+    """
+    count = len(layout)
+    shown = count
+    if count > max_nodes:
+        # Вузли впорядковані за рівнями: відрізаємо за першим рівнем, що не вміщається
+        cut_depth = layout.depth[max_nodes]
+        shown = max(1, int(np.searchsorted(layout.depth, cut_depth, side="left")))
+        title = f"{title} (рівні 0-{int(layout.depth[shown - 1])}, {shown} з {count} вузлів)"
+    x, y = layout.x[:shown], layout.y[:shown]
+
+    figure = plt.figure(figsize=(8, 5))
+    axes = figure.gca()
+    axes.set_axis_off()
+    if shown > 1:
+        child = np.arange(1, shown)
+        parent = layout.parent[1:shown]
+        segments = np.stack([np.column_stack((x[parent], y[parent])),
+                             np.column_stack((x[child], y[child]))], axis=1)
+        axes.add_collection(LineCollection(segments, colors="black", linewidths=1 if shown <= max_labels else 0.3))
+
+    # Розмір вузла зменшується з шириною найнижчого намальованого рівня
+    widest = int(np.max(np.bincount(layout.depth[:shown]))) if shown else 1
+    node_size = 2500 if shown <= max_labels else max(1, min(2500, 20000 / widest))
+    scatter = axes.scatter(x, y, s=node_size, c=colors[:shown], zorder=2)
+    if shown <= max_labels:
+        for i in range(shown):
+            axes.text(x[i], y[i], str(layout.nodes[i].val), ha="center", va="center", fontsize=12, zorder=3)
+    axes.margins(0.1, 0.15)
+    axes.set_title(title)
+    return figure, scatter, shown
+
+def render_traversals(root, orders=TRAVERSAL_ORDERS, filename="{order}_traversal.png", titles=None,
+                      max_nodes=4095, max_labels=63, layout=None):
+    """
+    Рендерить розфарбування дерева для кількох порядків обходу за один прохід:
+    розкладка обчислюється один раз, фігура будується один раз, а для кожного
+    порядку змінюються лише кольори вузлів і заголовок.
+
+    Параметри:
+        root (Node): Корінь дерева.
+        orders (iterable): Порядки обходу (див. traverse).
+        filename (str): Шаблон імені файлу з полем {order}.
+        titles (dict): Заголовки за порядком обходу.
+        max_nodes (int): Найбільша кількість вузлів, що малюються окремо.
+        max_labels (int): Найбільша кількість вузлів, що підписуються значеннями.
+        layout (TreeLayout): Готова розкладка цього дерева.
+
+    Повертає:
+        list: Імена збережених файлів.
+    """
+    if layout is None:
+        layout = TreeLayout(root)
+    titles = titles or TRAVERSAL_TITLES
+    figure = scatter = None
+    paths = []
+    for order in orders:
+        colors = layout.order_colors(order)
+        title = titles.get(order, order)
+        if figure is None:
+            figure, scatter, shown = _draw_layout(layout, colors, title, max_nodes, max_labels)
+            suffix = figure.gca().get_title()[len(title):]
+        else:
+            scatter.set_facecolor(colors[:shown])
+            figure.gca().set_title(title + suffix)
+        paths.append(filename.format(order=order))
+        figure.savefig(paths[-1], format="png", bbox_inches="tight")
+    if figure is not None:
+        plt.close(figure)
+    return paths
 
-    plt.figure(figsize=(8, 5))
-    nx.draw(tree, pos=pos, labels=labels, arrows=False, node_size=2500, node_color=colors)
-    plt.title(title)
-    plt.savefig(filename, format="png", bbox_inches="tight")
-    plt.close()
+def gradient_color(index, total):
+    """
+    Обчислює колір вузла за його порядковим номером у обході:
+    від темного #1a2b3c (перший вузол) до світлого (останній).
+
+    Параметри:
+        index (int): Порядковий номер вузла, починаючи з 0.
+        total (int): Загальна кількість вузлів.
+
+    Повертає:
+        str: Колір у форматі #rrggbb.
+    """
+    r = 0x1A + (255 - 26) * index // total
+    g = 0x2B + (238 - 43) * index // total
+    b = 0x3C + (255 - 60) * index // total
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+def traverse(root, order="bfs"):
+    """
+    Обходить дерево без рекурсії за O(n) і повертає вузли в порядку відвідування.
+
+    Довжина результату одразу дає кількість вузлів, тож окремий прохід
+    для підрахунку не потрібен, а множина відвіданих — теж: у дереві
+    кожен вузол досяжний рівно одним шляхом.
+
+    Параметри:
+        root (Node): Корінь дерева.
+        order (str): "bfs", "preorder", "inorder" або "postorder".
+
+    Повертає:
+        list: Вузли в порядку обходу.
+    """
+    if order not in TRAVERSAL_ORDERS:
+        raise ValueError(f"Невідомий порядок обходу: {order}")
+    result = []
+    if root is None:
+        return result
+
+    if order == "bfs":
+        queue = deque([root])  # popleft — O(1), на відміну від list.pop(0)
+        while queue:
+            node = queue.popleft()
+            result.append(node)
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+    elif order == "preorder":
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            result.append(node)
+            # Правий кладемо першим, щоб лівий вийшов зі стеку раніше
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+    elif order == "inorder":
+        stack = []
+        current = root
+        while current or stack:
+            while current:
+                stack.append(current)
+                current = current.left
+            current = stack.pop()
+            result.append(current)
+            current = current.right
+    else:
+        # Зворотний порядок «корінь, правий, лівий», розвернутий, — це post-order
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            result.append(node)
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        result.reverse()
+    return result
+
+Visit = namedtuple("Visit", "node depth index")
+
+def iter_traversal(root, order="bfs", max_depth=None, prune=None):
+    """
+    Лінивий обхід дерева: видає вузли по одному разом із глибиною
+    та порядковим номером. Споживач може зупинитися будь-коли —
+    решта дерева тоді не обходиться, а пам'ять обмежена чергою
+    (BFS) або стеком завглибшки з дерево (DFS).
+
+    Параметри:
+        root (Node): Корінь дерева.
+        order (str): "bfs", "preorder", "inorder" або "postorder".
+        max_depth (int): Не заходити глибше цього рівня (корінь — рівень 0).
+        prune (callable): prune(node, depth) -> True пропускає вузол
+            разом з усім його піддеревом.
+
+    Для повного обходу без глибини та відсікання швидший traverse.
+
+    Повертає:
+        generator: Записи Visit(node, depth, index).
+    """
+    if order not in TRAVERSAL_ORDERS:
+        raise ValueError(f"Невідомий порядок обходу: {order}")
+    if root is None:
+        return
+
+    def admit(node, depth):
+        return (node is not None and (max_depth is None or depth <= max_depth)
+                and (prune is None or not prune(node, depth)))
+
+    if not admit(root, 0):
+        return
+    index = 0
+    if order == "bfs":
+        queue = deque([(root, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            yield Visit(node, depth, index)
+            index += 1
+            for child in (node.left, node.right):
+                if admit(child, depth + 1):
+                    queue.append((child, depth + 1))
+    elif order == "preorder":
+        stack = [(root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            yield Visit(node, depth, index)
+            index += 1
+            for child in (node.right, node.left):
+                if admit(child, depth + 1):
+                    stack.append((child, depth + 1))
+    elif order == "inorder":
+        stack = []
+        current, depth = root, 0
+        while current or stack:
+            while current:
+                stack.append((current, depth))
+                current, depth = current.left, depth + 1
+                if not admit(current, depth):
+                    current = None
+            node, depth = stack.pop()
+            yield Visit(node, depth, index)
+            index += 1
+            current, depth = node.right, depth + 1
+            if not admit(current, depth):
+                current = None
+    else:
+        # Прапорець expanded: вузол видається після того, як оброблено нащадків
+        stack = [(root, 0, False)]
+        while stack:
+            node, depth, expanded = stack.pop()
+            if expanded:
+                yield Visit(node, depth, index)
+                index += 1
+                continue
+            stack.append((node, depth, True))
+            for child in (node.right, node.left):
+                if admit(child, depth + 1):
+                    stack.append((child, depth + 1, False))
+
+def find_node(root, predicate, order="bfs", max_depth=None):
+    """
+    Шукає перший вузол, для якого predicate(node) істинний, і зупиняє
+    обхід одразу після знахідки.
+
+    Повертає:
+        Visit: Знайдений вузол із глибиною та номером або None.
+    """
+    return next((visit for visit in iter_traversal(root, order, max_depth)
+                 if predicate(visit.node)), None)
+
+def stream_colors(visits, total, apply=True):
+    """
+    Потоковий етап розфарбування поверх лінивого обходу: додає до кожного
+    відвідування колір gradient_color за його номером.
+
+    Параметри:
+        visits (iterable): Записи Visit (наприклад, з iter_traversal).
+        total (int): Кількість вузлів, на яку розтягується градієнт.
+        apply (bool): Одразу записувати колір у node.color.
+
+    Повертає:
+        generator: Пари (Visit, колір).
+    """
+    for visit in visits:
+        color = gradient_color(visit.index, total)
+        if apply:
+            visit.node.color = color
+        yield visit, color
+
+def gradient_runs(total):
+    """
+    Ділить порядкові номери 0 ... total - 1 на відрізки однакового кольору
+    gradient_color. Канали змінюються не більше ніж 620 разів, тож рядок
+    кольору формується раз на відрізок, а не для кожного вузла.
+
+    Повертає:
+        list: Трійки (початок, кінець, колір).
+    """
+    # Значення каналу v з діапазоном span починається з індексу ceil(v * total / span)
+    breaks = {0, total}
+    for span in (255 - 26, 238 - 43, 255 - 60):
+        for value in range(1, span):
+            start = -(-value * total // span)
+            if start >= total:
+                break
+            breaks.add(start)
+    bounds = sorted(breaks)
+    return [(start, end, gradient_color(start, total)) for start, end in zip(bounds, bounds[1:])]
+
+def color_traversal(root, order="bfs"):
+    """
+    Розфарбовує вузли дерева градієнтом за порядком обходу — напряму
+    в атрибуті color, без проміжного словника та вкладених циклів.
+
+    Параметри:
+        root (Node): Корінь дерева.
+        order (str): Порядок обходу (див. traverse).
+
+    Повертає:
+        int: Кількість вузлів.
+    """
+    nodes = traverse(root, order)
+    for start, end, color in gradient_runs(len(nodes)):
+        for node in nodes[start:end]:
+            node.color = color
+    return len(nodes)
+
+def reset_colors(root, color="skyblue"):
+    """Повертає всім вузлам дерева початковий колір."""
+    for node in traverse(root, "preorder"):
+        node.color = color
+
+def build_tree(values):
+    """
+    Будує повне бінарне дерево з послідовності значень (у порядку рівнів)
+    без рекурсії — придатно для мільйонів вузлів.
+
+    Параметри:
+        values (iterable): Значення вузлів.
+
+    Повертає:
+        Node: Корінь дерева або None.
+    """
+    nodes = [Node(value) for value in values]
+    for i in range(1, len(nodes)):
+        parent = nodes[(i - 1) // 2]
+        if i % 2:
+            parent.left = nodes[i]
+        else:
+            parent.right = nodes[i]
+    return nodes[0] if nodes else None
 
 def dfs_iterative(root):
     """
@@ -70,47 +463,8 @@ def dfs_iterative(root):
     Повертає:
         dict: Мапа вузлів і їхніх кольорів.
     """
-    if not root:
-        return {}
-    
-    colors = {}
-    stack = []  # Стек для ітеративного DFS
-    visited = set()
-    visit_order = 0
-    total_nodes = 0
-    
-    # Підрахунок загальної кількості вузлів
-    def count_nodes(node):
-        nonlocal total_nodes
-        if node:
-            total_nodes += 1
-            count_nodes(node.left)
-            count_nodes(node.right)
-    
-    count_nodes(root)
-    
-    # Ініціалізація стеку з коренем
-    current = root
-    while current or stack:
-        while current:
-            stack.append(current)
-            current = current.left  # Спочатку йдемо вліво
-        
-        current = stack.pop()
-        if current.id not in visited:
-            visited.add(current.id)
-            visit_order += 1
-            
-            # Обчислюємо колір на основі порядку відвідування
-            r = int("1A", 16) + int((255 - 26) * (visit_order - 1) / total_nodes)
-            g = int("2B", 16) + int((238 - 43) * (visit_order - 1) / total_nodes)
-            b = int("3C", 16) + int((255 - 60) * (visit_order - 1) / total_nodes)
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            colors[current.id] = color
-            
-        current = current.right  # Переходимо вправо
-    
-    return colors
+    nodes = traverse(root, "inorder")
+    return {node.id: color for start, end, color in gradient_runs(len(nodes)) for node in nodes[start:end]}
 
 def bfs_iterative(root):
     """
@@ -122,46 +476,8 @@ def bfs_iterative(root):
     Повертає:
         dict: Мапа вузлів і їхніх кольорів.
     """
-    if not root:
-        return {}
-    
-    colors = {}
-    queue = []  # Черга для ітеративного BFS
-    visited = set()
-    visit_order = 0
-    total_nodes = 0
-    
-    # Підрахунок загальної кількості вузлів
-    def count_nodes(node):
-        nonlocal total_nodes
-        if node:
-            total_nodes += 1
-            count_nodes(node.left)
-            count_nodes(node.right)
-    
-    count_nodes(root)
-    
-    # Ініціалізація черги з коренем
-    queue.append(root)
-    while queue:
-        current = queue.pop(0)  # Вилучаємо перший елемент
-        if current.id not in visited:
-            visited.add(current.id)
-            visit_order += 1
-            
-            # Обчислюємо колір на основі порядку відвідування
-            r = int("1A", 16) + int((255 - 26) * (visit_order - 1) / total_nodes)
-            g = int("2B", 16) + int((238 - 43) * (visit_order - 1) / total_nodes)
-            b = int("3C", 16) + int((255 - 60) * (visit_order - 1) / total_nodes)
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            colors[current.id] = color
-            
-            if current.left:
-                queue.append(current.left)
-            if current.right:
-                queue.append(current.right)
-    
-    return colors
+    nodes = traverse(root, "bfs")
+    return {node.id: color for start, end, color in gradient_runs(len(nodes)) for node in nodes[start:end]}
 
 def main():
     """Створює дерево та візуалізує обходи DFS і BFS."""
@@ -173,29 +489,48 @@ def main():
     root.right = Node(1)
     root.right.left = Node(3)
     
-    # Виконуємо DFS і оновлюємо кольори
-    dfs_colors = dfs_iterative(root)
-    for node_id, color in dfs_colors.items():
-        for node in [root, root.left, root.right, root.left.left, root.left.right, root.right.left]:
-            if node.id == node_id:
-                node.color = color
+    # Розкладка обчислюється один раз для всіх рендерів цього дерева
+    layout = TreeLayout(root)
+
+    # Виконуємо DFS і розфарбовуємо вузли напряму
+    color_traversal(root, "inorder")
     
     # Візуалізуємо DFS
-    draw_tree(root, "Обхід у глибину (DFS)", "dfs_traversal.png")
+    draw_tree(root, "Обхід у глибину (DFS)", "dfs_traversal.png", layout=layout)
     
-    # Скидаємо кольори для BFS
-    for node in [root, root.left, root.right, root.left.left, root.left.right, root.right.left]:
-        node.color = "skyblue"
-    
-    # Виконуємо BFS і оновлюємо кольори
-    bfs_colors = bfs_iterative(root)
-    for node_id, color in bfs_colors.items():
-        for node in [root, root.left, root.right, root.left.left, root.left.right, root.right.left]:
-            if node.id == node_id:
-                node.color = color
+    # Скидаємо кольори та виконуємо BFS
+    reset_colors(root)
+    color_traversal(root, "bfs")
     
     # Візуалізуємо BFS
-    draw_tree(root, "Обхід у ширину (BFS)", "bfs_traversal.png")
+    draw_tree(root, "Обхід у ширину (BFS)", "bfs_traversal.png", layout=layout)
+
+    # Усі порядки обходу за один прохід зі спільною розкладкою
+    render_traversals(root, filename="{order}_order_traversal.png", layout=layout)
+
+    # Обхід великого дерева: O(n) без рекурсії
+    big_root = build_tree(range(500_000))
+    start_time = time.perf_counter()
+    for order in TRAVERSAL_ORDERS:
+        color_traversal(big_root, order)
+    print(f"4 обходи з розфарбуванням 500 000 вузлів: {time.perf_counter() - start_time:.2f} с")
+
+    # Велике дерево: автоматичний рівень деталізації
+    start_time = time.perf_counter()
+    render_traversals(big_root, orders=("bfs", "inorder"), filename="large_{order}_traversal.png")
+    print(f"Рендер великого дерева: {time.perf_counter() - start_time:.2f} с")
+
+    # Лінивий пошук зупиняється на першій знахідці
+    start_time = time.perf_counter()
+    found = find_node(big_root, lambda node: node.val == 20)
+    print(f"Знайдено вузол {found.node.val} на глибині {found.depth} (крок {found.index}) "
+          f"за {time.perf_counter() - start_time:.6f} с")
+
+    # Потокове розфарбування лише двох верхніх рівнів
+    reset_colors(root)
+    top_levels = iter_traversal(root, "bfs", max_depth=1)
+    for visit, color in stream_colors(top_levels, total=3):
+        print(f"Рівень {visit.depth}: вузол {visit.node.val} -> {color}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
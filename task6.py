@@ -1,5 +1,10 @@
 # Оптимізація вибору їжі з жадібним алгоритмом та динамічним програмуванням
 
+import bisect
+import math
+import time
+import numpy as np
+
 # Дані про їжу
 items = {
     "pizza": {"cost": 50, "calories": 300},
@@ -10,25 +15,27 @@ items = {
     "potato": {"cost": 25, "calories": 350}
 }
 
-def greedy_algorithm(budget):
+def ratio_order(catalog):
     """
-    Жадібний алгоритм для максимізації калорійності в межах бюджету.
-    
-    Параметри:
-        budget (int): Доступний бюджет.
-    
+    Впорядковує страви за спаданням співвідношення калорій до вартості.
+
     Повертає:
-        tuple: Список обраних страв і загальну калорійність.
+        list: Кортежі (назва, співвідношення, вартість, калорійність).
     """
-    # Обчислюємо співвідношення калорій до вартості
     items_with_ratio = []
-    for item, data in items.items():
+    for item, data in catalog.items():
         ratio = data["calories"] / data["cost"]
         items_with_ratio.append((item, ratio, data["cost"], data["calories"]))
-    
-    # Сортуємо за спаданням співвідношення
     items_with_ratio.sort(key=lambda x: x[1], reverse=True)
-    
+    return items_with_ratio
+
+def greedy_pick(items_with_ratio, budget):
+    """
+    Жадібно обирає страви з уже впорядкованого списку ratio_order.
+
+    Повертає:
+        tuple: Список обраних страв і загальну калорійність.
+    """
     selected_items = []
     total_calories = 0
     remaining_budget = budget
@@ -42,9 +49,9 @@ def greedy_algorithm(budget):
     
     return selected_items, total_calories
 
-def dynamic_programming(budget):
+def greedy_algorithm(budget):
     """
-    Динамічне програмування для максимізації калорійності в межах бюджету.
+    Жадібний алгоритм для максимізації калорійності в межах бюджету.
     
     Параметри:
         budget (int): Доступний бюджет.
@@ -52,44 +59,582 @@ def dynamic_programming(budget):
     Повертає:
         tuple: Список обраних страв і загальну калорійність.
     """
-    n = len(items)
-    # Ініціалізуємо таблицю DP: dp[i][j] — максимальна калорійність для i страв і бюджету j
-    dp = [[0 for _ in range(budget + 1)] for _ in range(n + 1)]
-    
-    # Ініціалізуємо таблицю для відновлення обраних страв
-    keep = [[False for _ in range(budget + 1)] for _ in range(n + 1)]
-    
-    # Перебираємо страви та бюджети
-    item_list = list(items.items())
-    for i in range(1, n + 1):
-        item_name, data = item_list[i - 1]
-        cost, calories = data["cost"], data["calories"]
-        for w in range(budget + 1):
-            if cost <= w:
-                # Обираємо максимум: без поточної страви або з поточною
-                without_current = dp[i - 1][w]
-                with_current = dp[i - 1][w - cost] + calories
-                if with_current > without_current:
-                    dp[i][w] = with_current
-                    keep[i][w] = True
-                else:
-                    dp[i][w] = without_current
-            else:
-                dp[i][w] = dp[i - 1][w]
-    
-    # Відновлюємо обрані страви
+    return greedy_pick(ratio_order(items), budget)
+
+def catalog_arrays(catalog):
+    """
+    Перетворює каталог страв на паралельні масиви NumPy.
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ...}.
+
+    Повертає:
+        tuple: Список назв, масив вартостей і масив калорійності.
+    """
+    names = list(catalog)
+    arrays = []
+    for key in ("cost", "calories"):
+        values = [catalog[name][key] for name in names]
+        # Цілі значення зводимо до int64, дробові — до float64
+        dtype = np.float64 if any(isinstance(value, float) for value in values) else np.int64
+        arrays.append(np.array(values, dtype=dtype))
+    costs, calories = arrays
+    return names, costs, calories
+
+def knapsack_tables(costs, calories, budget):
+    """
+    Обчислює останній рядок DP задачі 0-1 і упаковані рішення «брати».
+
+    Для кожної страви рядок оновлюється векторно: dp[w] = max(dp[w], dp[w - cost] + calories),
+    а рішення зберігаються як бітові маски (budget / 8 байтів на страву).
+    Префікс рядка й масок до будь-якого w ≤ budget — це точна відповідь
+    для бюджету w, тож одна таблиця обслуговує всі менші бюджети.
+
+    Параметри:
+        costs (np.ndarray): Вартості страв.
+        calories (np.ndarray): Калорійність страв.
+        budget (int): Найбільший бюджет.
+
+    Повертає:
+        tuple: Рядок dp та список масок (None для страв, дорожчих за бюджет).
+    """
+    row = np.zeros(budget + 1, dtype=calories.dtype)
+    keep = []  # Упаковані рішення для бюджетів cost ... budget
+    for cost, value in zip(costs.tolist(), calories.tolist()):
+        if cost > budget:
+            keep.append(None)
+            continue
+        with_current = row[:budget + 1 - cost] + value
+        take = with_current > row[cost:]
+        # with_current обчислено з попереднього рядка, тож запис не впливає на нього
+        np.maximum(row[cost:], with_current, out=row[cost:])
+        keep.append(np.packbits(take))
+    return row, keep
+
+def reconstruct(names, costs, keep, budget):
+    """
+    Відновлює обрані страви за масками knapsack_tables зворотним проходом за O(n).
+
+    Повертає:
+        list: Назви обраних страв у порядку каталогу.
+    """
     selected_items = []
     w = budget
-    for i in range(n, 0, -1):
-        if keep[i][w]:
-            item_name, data = item_list[i - 1]
-            selected_items.append(item_name)
-            w -= data["cost"]
+    for i in range(len(names) - 1, -1, -1):
+        bits, cost = keep[i], int(costs[i])
+        if bits is not None and w >= cost and (bits[(w - cost) >> 3] >> (7 - ((w - cost) & 7))) & 1:
+            selected_items.append(names[i])
+            w -= cost
+    return selected_items[::-1]
+
+def knapsack_01(catalog, budget):
+    """
+    Задача 0-1 про рюкзак з одним рядком DP замість таблиці (n+1) x (budget+1).
+
+    Страва береться лише за строгого покращення, тому результат збігається
+    з табличним алгоритмом.
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ...}.
+        budget (int): Доступний бюджет.
+
+    Повертає:
+        tuple: Список обраних страв і загальна калорійність.
+    """
+    names, costs, calories = catalog_arrays(catalog)
+    row, keep = knapsack_tables(costs, calories, budget)
+    return reconstruct(names, costs, keep, budget), row[budget].item()
+
+class KnapsackSolver:
+    """
+    Розв'язувач, прив'язаний до каталогу, для багатьох запитів з різними бюджетами.
+
+    Таблиця DP будується один раз до найбільшого потрібного бюджету:
+    калорійність для будь-якого меншого бюджету читається з рядка за O(1),
+    а вибір страв відновлюється за O(n). Впорядкування для жадібного
+    алгоритму теж кешується. Перед кожним запитом (для solve_many — один
+    раз на серію) знімок каталогу за O(n) порівнюється зі збереженим, тож
+    зміна словника (додавання, видалення, нові ціни) автоматично знецінює кеш.
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ...}; за замовчуванням items.
+    """
+
+    def __init__(self, catalog=None):
+        self.catalog = items if catalog is None else catalog
+        self.invalidate()
+
+    def invalidate(self):
+        """Скидає всі кешовані таблиці."""
+        self._signature = None
+        self._order = None
+        self._arrays = None
+        self._row = None
+        self._keep = None
+
+    def set_item(self, name, cost, calories):
+        """Додає страву або змінює її вартість і калорійність."""
+        self.catalog[name] = {"cost": cost, "calories": calories}
+        self.invalidate()
+
+    def remove_item(self, name):
+        """Видаляє страву з каталогу."""
+        del self.catalog[name]
+        self.invalidate()
+
+    def _check_catalog(self):
+        """Знецінює кеш, якщо каталог змінився з часу останнього запиту."""
+        signature = tuple((name, data["cost"], data["calories"]) for name, data in self.catalog.items())
+        if signature != self._signature:
+            self.invalidate()
+            self._signature = signature
+
+    def _ensure_budget(self, budget):
+        """Перебудовує таблицю, якщо бюджет більший за вже обчислений."""
+        if self._row is None or budget >= len(self._row):
+            if self._arrays is None:
+                self._arrays = catalog_arrays(self.catalog)
+            # Запас удвічі: серія зростаючих бюджетів перебудовує таблицю O(log B) разів
+            capacity = max(budget, 2 * (len(self._row) - 1) if self._row is not None else 0)
+            _, costs, calories = self._arrays
+            self._row, self._keep = knapsack_tables(costs, calories, capacity)
+
+    def best_calories(self, budget):
+        """
+        Найбільша калорійність для бюджету: перевірка каталогу за O(n),
+        далі — читання з рядка за O(1). Від'ємний бюджет дає 0.
+        """
+        self._check_catalog()
+        return self._best_calories(budget)
+
+    def _best_calories(self, budget):
+        if budget < 0:
+            return 0
+        self._ensure_budget(budget)
+        return self._row[budget].item()
+
+    def optimal(self, budget):
+        """
+        Оптимальний вибір (як dynamic_programming) за O(n) після побудови таблиці.
+        Для від'ємного бюджету повертає ([], 0), як і жадібний алгоритм.
+
+        Повертає:
+            tuple: Список обраних страв і загальна калорійність.
+        """
+        self._check_catalog()
+        return self._optimal(budget)
+
+    def _optimal(self, budget):
+        if budget < 0:
+            return [], 0
+        self._ensure_budget(budget)
+        names, costs, _ = self._arrays
+        return reconstruct(names, costs, self._keep, budget), self._row[budget].item()
+
+    def greedy(self, budget):
+        """
+        Жадібний вибір (як greedy_algorithm) без повторного сортування.
+
+        Повертає:
+            tuple: Список обраних страв і загальна калорійність.
+        """
+        self._check_catalog()
+        return self._greedy(budget)
+
+    def _greedy(self, budget):
+        if self._order is None:
+            self._order = ratio_order(self.catalog)
+        return greedy_pick(self._order, budget)
+
+    def solve_many(self, budgets, method="optimal"):
+        """
+        Відповідає на серію бюджетів; каталог перевіряється один раз,
+        а таблиця будується один раз до найбільшого бюджету.
+
+        Параметри:
+            budgets (iterable): Бюджети.
+            method (str): "optimal" або "greedy".
+
+        Повертає:
+            dict: Бюджет -> (список страв, калорійність).
+        """
+        solve = {"optimal": self._optimal, "greedy": self._greedy}[method]
+        budgets = list(budgets)
+        self._check_catalog()
+        if method == "optimal" and budgets and max(budgets) >= 0:
+            self._ensure_budget(max(budgets))
+        return {budget: solve(budget) for budget in budgets}
+
+def dynamic_programming(budget):
+    """
+    Динамічне програмування для максимізації калорійності в межах бюджету.
     
-    return selected_items[::-1], dp[n][budget]
+    Параметри:
+        budget (int): Доступний бюджет.
+    
+    Повертає:
+        tuple: Список обраних страв і загальну калорійність.
+    """
+    return knapsack_01(items, budget)
+
+def branch_and_bound(catalog, budget, node_limit=None):
+    """
+    Точний метод гілок і меж для великих або дробових вартостей.
+
+    Страви перебираються у порядку ratio_order; верхня межа вузла — розв'язок
+    LP-релаксації (дробовий жадібний алгоритм) для решти страв, який
+    обчислюється за O(log n) через префіксні суми. Початкова нижня межа —
+    звичайний жадібний вибір.
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ...} (вартості додатні).
+        budget (float): Доступний бюджет.
+        node_limit (int): Найбільша кількість вузлів; при перевищенні — RuntimeError.
+
+    Повертає:
+        tuple: Список обраних страв і загальна калорійність.
+    """
+    order = ratio_order(catalog)
+    n = len(order)
+    prefix_cost = [0]
+    prefix_calories = [0]
+    for _, _, cost, calories in order:
+        prefix_cost.append(prefix_cost[-1] + cost)
+        prefix_calories.append(prefix_calories[-1] + calories)
+
+    def bound(i, capacity):
+        # Цілі страви i ... k - 1 вміщаються, страва k — частково
+        k = bisect.bisect_right(prefix_cost, prefix_cost[i] + capacity, lo=i) - 1
+        value = prefix_calories[k] - prefix_calories[i]
+        if k < n:
+            value += (capacity - (prefix_cost[k] - prefix_cost[i])) * order[k][1]
+        return value
+
+    best_items, best_value = greedy_pick(order, budget)
+    best_chosen = None
+    stack = [(0, 0, 0, None)]  # (індекс, витрачено, калорійність, зв'язний список обраних)
+    visited = 0
+    while stack:
+        i, spent, value, chosen = stack.pop()
+        visited += 1
+        if node_limit is not None and visited > node_limit:
+            raise RuntimeError(f"Перевищено ліміт вузлів: {node_limit}")
+        if value > best_value:
+            best_value, best_chosen = value, chosen
+        if i == n or value + bound(i, budget - spent) <= best_value:
+            continue
+        stack.append((i + 1, spent, value, chosen))
+        cost, calories = order[i][2], order[i][3]
+        # Гілку «брати» кладемо останньою, щоб вона обходилась першою
+        if spent + cost <= budget:
+            stack.append((i + 1, spent + cost, value + calories, (i, chosen)))
+
+    if best_chosen is not None:
+        taken = set()
+        while best_chosen is not None:
+            index, best_chosen = best_chosen
+            taken.add(order[index][0])
+        best_items = [name for name in catalog if name in taken]
+    else:
+        best_items = [name for name in catalog if name in set(best_items)]
+    return best_items, best_value
+
+def fptas(catalog, budget, epsilon=0.1):
+    """
+    Повністю поліноміальна схема наближення: калорійність гарантовано
+    не менша за (1 - epsilon) від оптимуму, а час — O(n^2 / epsilon)
+    незалежно від величини вартостей.
+
+    Нижня межа LB — кращий з жадібного префікса за ratio та найкращої
+    окремої страви (LB ≥ OPT / 2); верхня — LP-релаксація (≤ 2 · LB).
+    Калорійність масштабується на K = epsilon * LB / n й округлюється вниз,
+    після чого DP рахує мінімальну вартість для кожної масштабованої
+    калорійності до UB / K ≤ 2n / epsilon векторними рядками — розмір
+    таблиці не залежить від бюджету, тож вартості можуть бути дробовими.
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ...} (вартості додатні).
+        budget (float): Доступний бюджет.
+        epsilon (float): Допустима відносна похибка, 0 < epsilon < 1.
+
+    Повертає:
+        tuple: Список обраних страв і їхня справжня калорійність.
+    """
+    if not 0 < epsilon < 1:
+        raise ValueError("epsilon має бути в інтервалі (0, 1)")
+    names, costs, calories = catalog_arrays(catalog)
+    fits = (costs <= budget) & (calories > 0)
+    if not fits.any():
+        return [], 0
+
+    # Межі оптимуму з дробового жадібного розв'язку
+    fit_costs, fit_calories = costs[fits], calories[fits]
+    order = np.argsort(-(fit_calories / fit_costs), kind="stable")
+    prefix_cost = np.cumsum(fit_costs[order])
+    prefix_calories = np.cumsum(fit_calories[order])
+    whole = int(np.searchsorted(prefix_cost, budget, side="right"))
+    greedy_value = prefix_calories[whole - 1] if whole else 0
+    lower = max(greedy_value, fit_calories.max())
+    upper = greedy_value
+    if whole < len(order):
+        spare = budget - (prefix_cost[whole - 1] if whole else 0)
+        upper += spare * fit_calories[order[whole]] / fit_costs[order[whole]]
+
+    scale = epsilon * lower / fits.sum()
+    scaled = np.where(fits, np.floor(calories / scale), 0).astype(np.int64)
+    total = int(min(scaled.sum(), np.floor(upper / scale)))
+    row = np.full(total + 1, np.inf)
+    row[0] = 0
+    keep = []
+    for cost, value in zip(costs.tolist(), scaled.tolist()):
+        if value == 0 or value > total:
+            keep.append(None)
+            continue
+        with_current = row[:total + 1 - value] + cost
+        take = with_current < row[value:]
+        np.minimum(row[value:], with_current, out=row[value:])
+        keep.append(np.packbits(take))
+
+    best = int(np.flatnonzero(row <= budget).max())
+    selected_items = reconstruct(names, scaled, keep, best)
+    return selected_items, sum(catalog[name]["calories"] for name in selected_items)
+
+def _subset_sums(costs, calories):
+    """Вартості, калорійності та бітові маски всіх підмножин (до ~2^22)."""
+    subset_costs = np.zeros(1, dtype=costs.dtype)
+    subset_calories = np.zeros(1, dtype=calories.dtype)
+    masks = np.zeros(1, dtype=np.int64)
+    for bit, (cost, value) in enumerate(zip(costs, calories)):
+        subset_costs = np.concatenate((subset_costs, subset_costs + cost))
+        subset_calories = np.concatenate((subset_calories, subset_calories + value))
+        masks = np.concatenate((masks, masks | (1 << bit)))
+    return subset_costs, subset_calories, masks
+
+def meet_in_the_middle(catalog, budget):
+    """
+    Точний розв'язок для малої кількості страв (до ~40) з довільно великим
+    або дробовим бюджетом за O(2^(n/2) · n).
+
+    Каталог ділиться навпіл; для другої половини підмножини сортуються
+    за вартістю з префіксним максимумом калорійності, і кожна підмножина
+    першої половини доповнюється найкращою сумісною бінарним пошуком.
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ...}.
+        budget (float): Доступний бюджет.
+
+    Повертає:
+        tuple: Список обраних страв і загальна калорійність.
+    """
+    names, costs, calories = catalog_arrays(catalog)
+    half = len(names) // 2
+    left_costs, left_calories, left_masks = _subset_sums(costs[:half], calories[:half])
+    right_costs, right_calories, right_masks = _subset_sums(costs[half:], calories[half:])
+
+    order = np.argsort(right_costs, kind="stable")
+    right_costs, right_calories, right_masks = right_costs[order], right_calories[order], right_masks[order]
+    running_best = np.maximum.accumulate(right_calories)
+    # Позиція, на якій досягається префіксний максимум
+    best_position = np.maximum.accumulate(np.where(right_calories == running_best, np.arange(len(order)), 0))
+
+    feasible = left_costs <= budget
+    partner = np.searchsorted(right_costs, budget - left_costs, side="right") - 1
+    totals = np.where(feasible, left_calories + running_best[np.maximum(partner, 0)], -1)
+    winner = int(np.argmax(totals))
+    chosen = int(left_masks[winner]) | int(right_masks[best_position[partner[winner]]]) << half
+    selected_items = [name for i, name in enumerate(names) if (chosen >> i) & 1]
+    return selected_items, totals[winner].item()
+
+def split_quantities(catalog, default_quantity=1):
+    """
+    Бінарне розбиття кількостей: страва з лімітом q замінюється пакетами
+    розміром 1, 2, 4, ..., залишок. Будь-яка кількість 0 ... q складається
+    з пакетів рівно одним набором, тож задача з лімітами зводиться до 0-1
+    з O(Σ log q) предметів замість Σ q.
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ..., "quantity": ...}.
+        default_quantity (int): Ліміт для страв без "quantity".
+
+    Повертає:
+        tuple: Список (назва, розмір пакета) і каталог пакетів для catalog_arrays.
+    """
+    chunks = []
+    chunk_catalog = {}
+    for name, data in catalog.items():
+        quantity = data.get("quantity", default_quantity)
+        size = 1
+        while quantity > 0:
+            size = min(size, quantity)
+            chunk_catalog[len(chunks)] = {key: value * size for key, value in data.items() if key != "quantity"}
+            chunks.append((name, size))
+            quantity -= size
+            size *= 2
+    return chunks, chunk_catalog
+
+def _count_chunks(chunks, taken):
+    """Підсумовує обрані пакети в кількості страв (у порядку каталогу)."""
+    counts = {}
+    for index in taken:
+        name, size = chunks[index]
+        counts[name] = counts.get(name, 0) + size
+    return counts
+
+def bounded_knapsack(catalog, budget, default_quantity=1):
+    """
+    Задача про рюкзак з обмеженою кількістю кожної страви.
+
+    Пакети з split_quantities розв'язуються тим самим векторним рядком
+    і бітовими масками, що й knapsack_01: пам'ять — budget / 8 байтів
+    на пакет, тобто O(budget · Σ log q) бітів.
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ..., "quantity": ...}.
+        budget (int): Доступний бюджет.
+        default_quantity (int): Ліміт для страв без "quantity".
+
+    Повертає:
+        tuple: Словник назва -> кількість і загальна калорійність.
+    """
+    chunks, chunk_catalog = split_quantities(catalog, default_quantity)
+    indices, costs, calories = catalog_arrays(chunk_catalog)
+    row, keep = knapsack_tables(costs, calories, budget)
+    return _count_chunks(chunks, reconstruct(indices, costs, keep, budget)), row[budget].item()
+
+def unbounded_knapsack(catalog, budget):
+    """
+    Задача про рюкзак без обмеження кількості страв.
+
+    Кожна страва додається пакетами 1, 2, 4, ... (поки вміщаються) як 0-1
+    предмети векторними оновленнями рядка — разом вони дають будь-яку
+    кількість до budget // cost. Замість масок зберігається лише останній
+    пакет, що покращив dp[w]: оскільки підсумковий рядок — оптимум без
+    обмежень, dp[w] = dp[w - пакет] + калорійність пакета для фінальних
+    значень, і ланцюжок відновлюється за O(budget) пам'яті.
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ...} (вартості додатні).
+        budget (int): Доступний бюджет.
+
+    Повертає:
+        tuple: Словник назва -> кількість і загальна калорійність.
+    """
+    names, costs, calories = catalog_arrays(catalog)
+    row = np.zeros(budget + 1, dtype=calories.dtype)
+    last_item = np.full(budget + 1, -1, dtype=np.int64)
+    last_size = np.zeros(budget + 1, dtype=np.int64)
+    for i, (cost, value) in enumerate(zip(costs.tolist(), calories.tolist())):
+        size = 1
+        while size * cost <= budget:
+            chunk_cost = size * cost
+            with_current = row[:budget + 1 - chunk_cost] + size * value
+            take = with_current > row[chunk_cost:]
+            np.maximum(row[chunk_cost:], with_current, out=row[chunk_cost:])
+            last_item[chunk_cost:][take] = i
+            last_size[chunk_cost:][take] = size
+            size *= 2
+
+    counts = {}
+    w = budget
+    while last_item[w] >= 0:
+        i, size = int(last_item[w]), int(last_size[w])
+        counts[names[i]] = counts.get(names[i], 0) + size
+        w -= size * int(costs[i])
+    return {name: counts[name] for name in names if name in counts}, row[budget].item()
+
+def knapsack_2d(catalog, budget, capacity, second="weight", default_quantity=1):
+    """
+    Задача про рюкзак з двома обмеженнями: вартість ≤ budget і, наприклад,
+    вага або час приготування ≤ capacity. Кількості обмежуються як
+    у bounded_knapsack.
+
+    Стан DP — одна двовимірна таблиця (budget + 1) x (capacity + 1),
+    яка оновлюється для кожного пакета одним векторним зсувом по обох осях;
+    рішення зберігаються як упаковані біти (розмір таблиці / 8 байтів на пакет).
+
+    Параметри:
+        catalog (dict): Назва -> {"cost": ..., "calories": ..., second: ..., "quantity": ...}.
+        budget (int): Доступний бюджет.
+        capacity (int): Ліміт другого обмеження.
+        second (str): Ключ другого обмеження.
+        default_quantity (int): Ліміт для страв без "quantity".
+
+    Повертає:
+        tuple: Словник назва -> кількість і загальна калорійність.
+    """
+    chunks, chunk_catalog = split_quantities(catalog, default_quantity)
+    _, costs, calories = catalog_arrays(chunk_catalog)
+    amounts = np.array([chunk_catalog[index][second] for index in range(len(chunks))], dtype=np.int64)
+
+    table = np.zeros((budget + 1, capacity + 1), dtype=calories.dtype)
+    keep = []
+    for cost, amount, value in zip(costs.tolist(), amounts.tolist(), calories.tolist()):
+        if cost > budget or amount > capacity:
+            keep.append(None)
+            continue
+        with_current = table[:budget + 1 - cost, :capacity + 1 - amount] + value
+        take = with_current > table[cost:, amount:]
+        np.maximum(table[cost:, amount:], with_current, out=table[cost:, amount:])
+        keep.append(np.packbits(take))
+
+    taken = []
+    b, c = budget, capacity
+    for i in range(len(chunks) - 1, -1, -1):
+        bits, cost, amount = keep[i], int(costs[i]), int(amounts[i])
+        if bits is None or b < cost or c < amount:
+            continue
+        # Маска пакета має форму (budget + 1 - cost) x (capacity + 1 - amount)
+        position = (b - cost) * (capacity + 1 - amount) + (c - amount)
+        if (bits[position >> 3] >> (7 - (position & 7))) & 1:
+            taken.append(i)
+            b, c = b - cost, c - amount
+    return _count_chunks(chunks, taken[::-1]), table[budget, capacity].item()
+
+def benchmark_engines(catalog, budget, epsilon=0.1, dp_cells=200_000_000, mitm_items=40,
+                      node_limit=2_000_000):
+    """
+    Запускає придатні для каталогу рушії, перевіряє результати та обирає
+    найшвидший правильний (той, що досягає найкращої точної калорійності).
+
+    Рушій пропускається, якщо він заздалегідь непридатний: DP — для
+    дробових вартостей або таблиці більшої за dp_cells, meet-in-the-middle —
+    для понад mitm_items страв, гілки і межі — при перевищенні node_limit.
+
+    Повертає:
+        tuple: Назва найшвидшого правильного рушія та словник
+            назва -> (час у секундах, калорійність) або None, якщо рушій пропущено.
+    """
+    _, costs, _ = catalog_arrays(catalog)
+    n = len(costs)
+    runs = {
+        "dynamic_programming": (lambda: knapsack_01(catalog, int(budget)))
+        if costs.dtype.kind != "f" and float(budget).is_integer() and n * (budget + 1) <= dp_cells else None,
+        "branch_and_bound": lambda: branch_and_bound(catalog, budget, node_limit),
+        "meet_in_the_middle": (lambda: meet_in_the_middle(catalog, budget)) if n <= mitm_items else None,
+        "fptas": lambda: fptas(catalog, budget, epsilon),
+    }
+    results = {}
+    for name, run in runs.items():
+        if run is None:
+            results[name] = None
+            continue
+        start_time = time.perf_counter()
+        try:
+            _, calories = run()
+        except RuntimeError:
+            results[name] = None
+            continue
+        results[name] = (time.perf_counter() - start_time, calories)
+
+    exact = [results[name][1] for name in ("dynamic_programming", "branch_and_bound", "meet_in_the_middle")
+             if results[name] is not None]
+    target = max(exact) if exact else results["fptas"][1]
+    correct = [name for name, result in results.items()
+               if result is not None and math.isclose(result[1], target, rel_tol=1e-9)]
+    return min(correct, key=lambda name: results[name][0]), results
 
 def main():
-    """Приклад використання обох алгоритмів."""
+    """Приклад використання алгоритмів."""
     budget = 100
     print(f"Бюджет: {budget} одиниць")
     
@@ -101,5 +646,51 @@ def main():
     dp_items, dp_calories = dynamic_programming(budget)
     print(f"Динамічне програмування: Страви {dp_items}, Калорійність: {dp_calories}")
 
+    # Серія бюджетів на тому самому каталозі: таблиця будується один раз
+    solver = KnapsackSolver(items)
+    for query_budget, (selected, calories) in solver.solve_many(range(0, 151, 25)).items():
+        print(f"Бюджет {query_budget}: {selected}, калорійність {calories}")
+    solver.set_item("salad", cost=5, calories=80)
+    print(f"Після додавання салату, бюджет {budget}: {solver.optimal(budget)}")
+    solver.remove_item("salad")
+
+    # Великий каталог: один рядок DP і бітові маски замість двох таблиць
+    rng = np.random.default_rng(0)
+    large_catalog = {
+        f"item-{i}": {"cost": int(cost), "calories": int(calories)}
+        for i, (cost, calories) in enumerate(rng.integers(1, 5000, size=(1000, 2)))
+    }
+    start_time = time.perf_counter()
+    large_items, large_calories = knapsack_01(large_catalog, 200_000)
+    print(f"1000 страв, бюджет 200 000: {len(large_items)} страв, калорійність {large_calories}, "
+          f"{time.perf_counter() - start_time:.2f} с")
+
+    # Обмежені кількості, необмежені кількості та друге обмеження (вага)
+    menu = {
+        "pizza": {"cost": 50, "calories": 300, "weight": 400, "quantity": 1},
+        "hamburger": {"cost": 40, "calories": 250, "weight": 250, "quantity": 2},
+        "hot-dog": {"cost": 30, "calories": 200, "weight": 150, "quantity": 3},
+        "pepsi": {"cost": 10, "calories": 100, "weight": 330, "quantity": 4},
+        "cola": {"cost": 15, "calories": 220, "weight": 330, "quantity": 2},
+        "potato": {"cost": 25, "calories": 350, "weight": 200, "quantity": 2},
+    }
+    print(f"З лімітами кількості: {bounded_knapsack(menu, budget)}")
+    print(f"Без лімітів кількості: {unbounded_knapsack(items, budget)}")
+    print(f"З лімітами та вагою ≤ 800: {knapsack_2d(menu, budget, 800)}")
+
+    # Вибір рушія для різних форм каталогу
+    shapes = {
+        "багато страв, малий бюджет": (large_catalog, 50_000),
+        "мало страв, величезні ціни": ({f"item-{i}": {"cost": int(cost) * 10**6, "calories": int(calories)}
+                                        for i, (cost, calories) in enumerate(rng.integers(1, 5000, size=(30, 2)))},
+                                       40_000 * 10**6),
+        "дробові ціни": ({f"item-{i}": {"cost": float(cost), "calories": int(calories)}
+                          for i, (cost, calories) in enumerate(rng.uniform(1, 100, size=(200, 2)))}, 2500.5),
+    }
+    for shape, (catalog, shape_budget) in shapes.items():
+        fastest, results = benchmark_engines(catalog, shape_budget)
+        timings = ", ".join(f"{name} {result[0]:.3f} с" for name, result in results.items() if result)
+        print(f"{shape}: найшвидший {fastest} ({timings})")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file